@@ -1,4 +1,5 @@
 from .orchestrator import HealthcareDataAgent
 from .prompts import SYSTEM_PROMPT
+from .response_cache import ResponseCache
 
-__all__ = ["HealthcareDataAgent", "SYSTEM_PROMPT"]
+__all__ = ["HealthcareDataAgent", "ResponseCache", "SYSTEM_PROMPT"]
@@ -1,28 +1,80 @@
 """Main agent orchestrator using Anthropic API with tool use."""
 
+import asyncio
+import io
 import json
-from typing import Any, Generator, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Generator, Optional
 
 import anthropic
 
-from agent.prompts import build_system_prompt
-from database.connection import DatabaseConnection
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json works too
+    orjson = None
+
+from agent.prompts import build_data_dictionary_message, build_system_prompt
+from agent.response_cache import ResponseCache
+from database.connection import DatabaseConnection, get_db
 from database.data_dictionary import DataDictionary, get_data_dictionary
 from tools.discovery import DiscoveryTool, DISCOVERY_TOOLS
 from tools.sql_executor import SQLExecutorTool, SQL_EXECUTOR_TOOLS
-from tools.visualization import VisualizationTool, VISUALIZATION_TOOLS
+from tools.visualization import VISUALIZATION_TOOLS
 from utils.security import SQLValidator
 
 
+# Combined once at import so every agent shares one frozen, byte-identical
+# tool schema sequence (identical serialization keeps the provider's
+# tools-block cache warm across instances)
+_ALL_TOOLS = DISCOVERY_TOOLS + SQL_EXECUTOR_TOOLS + VISUALIZATION_TOOLS
+
+
+def _serialize_tool_result(result: Any) -> str:
+    """Serialize a tool result for the message history (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            result,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+    return json.dumps(result, default=str)
+
+
 class HealthcareDataAgent:
     """Agent for natural language exploration of healthcare data."""
 
+    # Fixed attribute layout: skips the per-instance __dict__, shrinking
+    # each agent and making hot-path attribute access an offset lookup
+    __slots__ = (
+        "client",
+        "async_client",
+        "model",
+        "db",
+        "validator",
+        "discovery",
+        "sql_executor",
+        "_visualization",
+        "data_dictionary",
+        "system_prompt",
+        "system_blocks",
+        "_pinned_messages",
+        "messages",
+        "tools",
+        "last_query_results",
+        "pending_sql",
+        "response_cache",
+        "_tool_dispatch",
+        "_active_stream",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         db_path: Optional[str] = None,
         model: str = "claude-sonnet-4-20250514",
         data_dictionary: Optional[DataDictionary] = None,
+        warm_on_init: bool = True,
     ):
         """
         Initialize the healthcare data agent.
@@ -32,89 +84,360 @@ class HealthcareDataAgent:
             db_path: Path to SQLite database
             model: Claude model to use
             data_dictionary: Pre-generated data dictionary (generates one if not provided)
+            warm_on_init: Prime the provider prompt cache in the background
         """
         self.client = anthropic.Anthropic(api_key=api_key)
+        self.async_client = anthropic.AsyncAnthropic(api_key=api_key)
         self.model = model
 
         # Initialize database and tools
-        self.db = DatabaseConnection(db_path=db_path) if db_path else DatabaseConnection()
+        self.db = DatabaseConnection(db_path=db_path) if db_path else get_db()
         self.validator = SQLValidator()
         self.discovery = DiscoveryTool(self.db)
         self.sql_executor = SQLExecutorTool(self.db, self.validator)
-        self.visualization = VisualizationTool()
+        self._visualization = None  # created on first use (pulls in plotly)
 
         # Load or use provided data dictionary (generated ONCE)
         self.data_dictionary = data_dictionary or get_data_dictionary()
 
-        # Build system prompt with data dictionary context
-        self.system_prompt = build_system_prompt(self.data_dictionary.to_llm_context())
-
-        # Conversation history
-        self.messages: list[dict] = []
-
-        # Tools available to the agent
+        # Guidelines-only system prompt; the data dictionary travels as a
+        # pinned user message so guideline edits don't invalidate its cache
+        self.system_prompt = build_system_prompt()
+
+        # Structured system block with a cache breakpoint so the provider
+        # caches the prefilled prefix (tool schemas + system prompt) and
+        # reuses it across turns instead of re-processing it every call
+        self.system_blocks = [
+            {
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+        # Pinned conversation prefix carrying the data dictionary behind
+        # its own cache breakpoint, independent of the guidelines prefix
+        self._pinned_messages = [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": build_data_dictionary_message(
+                            self.data_dictionary.to_llm_context()
+                        ),
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            },
+            {
+                "role": "assistant",
+                "content": (
+                    "Understood. I have the full schema and will use it to "
+                    "write queries."
+                ),
+            },
+        ]
+
+        # Conversation history (starts with the pinned dictionary prefix)
+        self.messages: list[dict] = list(self._pinned_messages)
+
+        # Tools available to the agent (shared frozen schema sequence)
         # Discovery tools are still available but rarely needed since schema is in prompt
-        self.tools = DISCOVERY_TOOLS + SQL_EXECUTOR_TOOLS + VISUALIZATION_TOOLS
+        self.tools = _ALL_TOOLS
+
+        # O(1) tool dispatch table; tools that touch shared state are
+        # bound methods so the mutations stay centralized
+        self._tool_dispatch = {
+            "get_database_overview": lambda i: self.discovery.get_database_overview(),
+            "get_table_details": lambda i: self.discovery.get_table_details(
+                i["table_name"]
+            ),
+            "get_column_values": lambda i: self.discovery.get_column_values(
+                i["table_name"], i["column_name"], i.get("limit", 100)
+            ),
+            "search_columns": lambda i: self.discovery.search_columns(
+                i["search_term"]
+            ),
+            "validate_sql": lambda i: self.sql_executor.validate_query(i["sql"]),
+            "execute_sql": self._run_execute_sql,
+            "export_results": self._run_export_results,
+            "suggest_charts": self._run_suggest_charts,
+            "create_chart": self._run_create_chart,
+            "derive_insights": self._run_derive_insights,
+        }
 
         # Track state
         self.last_query_results: Optional[list[dict]] = None
         self.pending_sql: Optional[str] = None
 
-    def _handle_tool_call(self, tool_name: str, tool_input: dict) -> Any:
-        """Execute a tool call and return the result."""
-
-        # Discovery tools (available but rarely needed)
-        if tool_name == "get_database_overview":
-            return self.discovery.get_database_overview()
-        elif tool_name == "get_table_details":
-            return self.discovery.get_table_details(tool_input["table_name"])
-        elif tool_name == "get_column_values":
-            return self.discovery.get_column_values(
-                tool_input["table_name"],
-                tool_input["column_name"],
-                tool_input.get("limit", 100),
+        # Cache of complete responses for repeated questions
+        self.response_cache = ResponseCache()
+
+        # In-flight stream, kept so cancel() can abort a stalled request
+        self._active_stream = None
+
+        # Prime the provider prompt cache off the user-facing critical
+        # path so the first real query skips the one-time prefill cost
+        if warm_on_init:
+            threading.Thread(target=self._warm_cache, daemon=True).start()
+
+    # Rows kept at each end of a query-result preview sent to the model
+    RESULT_PREVIEW_ROWS = 20
+
+    # History compaction: once the (approximate) history size crosses the
+    # budget, older turns are summarized so per-turn prefill stays bounded
+    HISTORY_TOKEN_BUDGET = 6000
+    HISTORY_KEEP_RECENT = 4  # most recent messages always kept verbatim
+    COMPACTION_MODEL = "claude-3-5-haiku-latest"
+
+    def _estimate_history_tokens(self) -> int:
+        """Cheap token estimate for the history (~4 characters per token)."""
+        total = 0
+        for message in self.messages:
+            content = message["content"]
+            total += len(content) if isinstance(content, str) else len(str(content))
+        return total // 4
+
+    def _summarize_messages(self, messages: list[dict]) -> str:
+        """Summarize older turns with a cheaper model; degrade to truncation."""
+        lines = []
+        for message in messages:
+            content = message["content"]
+            if not isinstance(content, str):
+                content = str(content)
+            lines.append(f"{message['role']}: {content[:2000]}")
+        transcript = "\n".join(lines)
+
+        try:
+            response = self.client.messages.create(
+                model=self.COMPACTION_MODEL,
+                max_tokens=512,
+                messages=[{
+                    "role": "user",
+                    "content": (
+                        "Summarize the following data-analysis conversation in a "
+                        "few short paragraphs. Preserve the questions asked, the "
+                        "SQL queries run, and the key findings:\n\n" + transcript
+                    ),
+                }],
             )
-        elif tool_name == "search_columns":
-            return self.discovery.search_columns(tool_input["search_term"])
-
-        # SQL tools
-        elif tool_name == "validate_sql":
-            return self.sql_executor.validate_query(tool_input["sql"])
-        elif tool_name == "execute_sql":
-            result = self.sql_executor.execute_query(tool_input["sql"])
-            if result.get("success"):
-                self.last_query_results = result.get("data", [])
-            return result
-        elif tool_name == "export_results":
-            results = tool_input.get("results", self.last_query_results or [])
-            return self.sql_executor.export_results(
-                results, tool_input.get("format", "csv")
+            return "".join(
+                block.text for block in response.content if block.type == "text"
             )
+        except Exception:
+            return transcript[:2000]
 
-        # Visualization tools
-        elif tool_name == "suggest_charts":
-            data = tool_input.get("data", self.last_query_results or [])
-            return self.visualization.suggest_charts(
-                data, tool_input.get("query_intent", "")
-            )
-        elif tool_name == "create_chart":
-            data = tool_input.get("data", self.last_query_results or [])
-            return self.visualization.create_chart(
-                data,
-                tool_input["chart_type"],
-                x=tool_input.get("x"),
-                y=tool_input.get("y"),
-                color=tool_input.get("color"),
-                title=tool_input.get("title"),
+    def _compact_history(self):
+        """
+        Replace older turns with a single summary message once the history
+        exceeds the token budget, keeping the most recent turns verbatim.
+
+        Converts session cost from O(n^2) (full history resent each turn)
+        to O(n), at the price of one cheap summarization call.
+        """
+        if self._estimate_history_tokens() <= self.HISTORY_TOKEN_BUDGET:
+            return
+
+        # Never compact the pinned data-dictionary prefix, and cut at a
+        # real user turn so tool_use/tool_result pairs stay intact
+        pinned = len(self._pinned_messages)
+        cut = len(self.messages) - self.HISTORY_KEEP_RECENT
+        while cut > pinned and not (
+            self.messages[cut]["role"] == "user"
+            and isinstance(self.messages[cut]["content"], str)
+        ):
+            cut -= 1
+        if cut <= pinned:
+            return
+
+        summary = self._summarize_messages(self.messages[pinned:cut])
+        self.messages = [
+            *self.messages[:pinned],
+            {"role": "user", "content": f"[PRIOR CONTEXT SUMMARY]\n{summary}"},
+            {"role": "assistant", "content": "Understood. Continuing with that context."},
+            *self.messages[cut:],
+        ]
+
+    def _model_view(self, tool_name: str, result: Any) -> Any:
+        """
+        Bound what a tool result contributes to the message history.
+
+        Full execute_sql payloads would otherwise live in `self.messages`
+        forever and be resent on every turn, growing prefill cost linearly
+        with each query. Large results are cut down to a head/tail preview
+        plus the row count; the complete rows stay server-side in
+        `last_query_results`, which the visualization and export tools
+        already read as their default input.
+        """
+        if tool_name != "execute_sql" or not isinstance(result, dict):
+            return result
+
+        rows = result.get("data") or []
+        if not result.get("success") or len(rows) <= 2 * self.RESULT_PREVIEW_ROWS:
+            return result
+
+        view = {key: value for key, value in result.items() if key != "data"}
+        view["data_preview"] = (
+            rows[: self.RESULT_PREVIEW_ROWS] + rows[-self.RESULT_PREVIEW_ROWS:]
+        )
+        view["rows_omitted"] = len(rows) - 2 * self.RESULT_PREVIEW_ROWS
+        view["note"] = (
+            "Preview only (first and last rows). The full result is retained "
+            "server-side and is used automatically by visualization and export tools."
+        )
+        return view
+
+    def _mark_history_cache_breakpoint(self):
+        """
+        Keep a single cache breakpoint on the last content block of the
+        conversation history so the provider can serve the prefix
+        (system + tools + prior turns) from cache on the next call.
+        """
+        last_marked = None
+        for message in self.messages[len(self._pinned_messages):]:
+            content = message["content"]
+            if not isinstance(content, list):
+                continue
+            for block in content:
+                if isinstance(block, dict):
+                    block.pop("cache_control", None)
+            if content and isinstance(content[-1], dict):
+                last_marked = content[-1]
+
+        if last_marked is not None:
+            last_marked["cache_control"] = {"type": "ephemeral"}
+
+    def _warm_cache(self):
+        """Issue a 1-token call so the provider caches the static prefix."""
+        try:
+            self.client.messages.create(
+                model=self.model,
+                max_tokens=1,
+                system=self.system_blocks,
+                tools=self.tools,
+                messages=[*self._pinned_messages, {"role": "user", "content": "ok"}],
             )
-        elif tool_name == "derive_insights":
-            data = tool_input.get("data", self.last_query_results or [])
-            return self.visualization.derive_insights(
-                data, tool_input.get("context", "")
+        except Exception:
+            pass  # best-effort: on failure the first real call pays prefill
+
+    @property
+    def visualization(self):
+        """Visualization tool, instantiated lazily on first chart request."""
+        if self._visualization is None:
+            from tools.visualization import VisualizationTool
+
+            self._visualization = VisualizationTool()
+        return self._visualization
+
+    def _run_execute_sql(self, tool_input: dict) -> Any:
+        """Execute SQL and remember the rows for downstream tools."""
+        result = self.sql_executor.execute_query(tool_input["sql"])
+        if result.get("success"):
+            self.last_query_results = result.get("data", [])
+        return result
+
+    def _run_export_results(self, tool_input: dict) -> Any:
+        results = tool_input.get("results", self.last_query_results or [])
+        return self.sql_executor.export_results(
+            results, tool_input.get("format", "csv")
+        )
+
+    def _run_suggest_charts(self, tool_input: dict) -> Any:
+        data = tool_input.get("data", self.last_query_results or [])
+        return self.visualization.suggest_charts(
+            data, tool_input.get("query_intent", "")
+        )
+
+    def _run_create_chart(self, tool_input: dict) -> Any:
+        data = tool_input.get("data", self.last_query_results or [])
+        return self.visualization.create_chart(
+            data,
+            tool_input["chart_type"],
+            x=tool_input.get("x"),
+            y=tool_input.get("y"),
+            color=tool_input.get("color"),
+            title=tool_input.get("title"),
+        )
+
+    def _run_derive_insights(self, tool_input: dict) -> Any:
+        data = tool_input.get("data", self.last_query_results or [])
+        return self.visualization.derive_insights(
+            data, tool_input.get("context", "")
+        )
+
+    def _handle_tool_call(self, tool_name: str, tool_input: dict) -> Any:
+        """Execute a tool call and return the result."""
+        handler = self._tool_dispatch.get(tool_name)
+        if handler is None:
+            return {"error": f"Unknown tool: {tool_name}"}
+        return handler(tool_input)
+
+    def _execute_tool_calls(self, tool_calls: list) -> dict[str, Any]:
+        """
+        Execute a batch of tool calls, running independent ones concurrently.
+
+        SQL executions run first and sequentially because they update
+        `last_query_results`, which the remaining tools may read as a
+        default input. The rest are independent reads and fan out to a
+        thread pool, with results keyed by tool_use id so the caller can
+        preserve the original ordering.
+        """
+        results: dict[str, Any] = {}
+
+        sql_calls = [tc for tc in tool_calls if tc.name == "execute_sql"]
+        other_calls = [tc for tc in tool_calls if tc.name != "execute_sql"]
+
+        for tool_call in sql_calls:
+            results[tool_call.id] = self._handle_tool_call(
+                tool_call.name, tool_call.input
             )
 
+        if len(other_calls) > 1:
+            with ThreadPoolExecutor(max_workers=len(other_calls)) as pool:
+                futures = [
+                    pool.submit(self._handle_tool_call, tc.name, tc.input)
+                    for tc in other_calls
+                ]
+                for tool_call, future in zip(other_calls, futures):
+                    results[tool_call.id] = future.result()
         else:
-            return {"error": f"Unknown tool: {tool_name}"}
+            for tool_call in other_calls:
+                results[tool_call.id] = self._handle_tool_call(
+                    tool_call.name, tool_call.input
+                )
+
+        return results
+
+    async def _handle_tool_call_async(self, tool_name: str, tool_input: dict) -> Any:
+        """Run a (synchronous) tool call off the event loop."""
+        return await asyncio.to_thread(self._handle_tool_call, tool_name, tool_input)
+
+    async def _execute_tool_calls_async(self, tool_calls: list) -> dict[str, Any]:
+        """
+        Async counterpart of _execute_tool_calls with the same two-phase
+        schedule: SQL executions first and in order, then the independent
+        reads fanned out with asyncio.gather.
+        """
+        results: dict[str, Any] = {}
+
+        sql_calls = [tc for tc in tool_calls if tc.name == "execute_sql"]
+        other_calls = [tc for tc in tool_calls if tc.name != "execute_sql"]
+
+        for tool_call in sql_calls:
+            results[tool_call.id] = await self._handle_tool_call_async(
+                tool_call.name, tool_call.input
+            )
+
+        if other_calls:
+            gathered = await asyncio.gather(*[
+                self._handle_tool_call_async(tc.name, tc.input)
+                for tc in other_calls
+            ])
+            for tool_call, result in zip(other_calls, gathered):
+                results[tool_call.id] = result
+
+        return results
 
     def chat(self, user_message: str) -> Generator[dict, None, None]:
         """
@@ -129,94 +452,192 @@ class HealthcareDataAgent:
         # Add user message to history
         self.messages.append({"role": "user", "content": user_message})
 
+        # Keep the resent history bounded before calling the model
+        self._compact_history()
+
         while True:
-            # Call Claude with tools and data dictionary in system prompt
-            response = self.client.messages.create(
+            # Extend the cache to cover stable history before the new content
+            self._mark_history_cache_breakpoint()
+
+            # Call Claude with tools and data dictionary in system prompt,
+            # streaming text deltas as they arrive so callers can render
+            # incrementally instead of waiting for the full generation
+            with self.client.messages.stream(
                 model=self.model,
                 max_tokens=4096,
-                system=self.system_prompt,
+                system=self.system_blocks,
                 tools=self.tools,
                 messages=self.messages,
-            )
-
-            # Process response content
-            assistant_content = []
-            tool_calls_to_process = []
-
-            for block in response.content:
-                if block.type == "text":
-                    assistant_content.append({"type": "text", "text": block.text})
-                    yield {"type": "text", "content": block.text}
-
-                elif block.type == "tool_use":
-                    assistant_content.append({
-                        "type": "tool_use",
-                        "id": block.id,
-                        "name": block.name,
-                        "input": block.input,
-                    })
-                    yield {
-                        "type": "tool_use",
-                        "tool_name": block.name,
-                        "tool_input": block.input,
-                    }
-                    tool_calls_to_process.append(block)
-
-            # Add assistant response to history
-            self.messages.append({"role": "assistant", "content": assistant_content})
+            ) as stream:
+                self._active_stream = stream
+                try:
+                    for delta in stream.text_stream:
+                        yield {"type": "text", "content": delta}
+                    response = stream.get_final_message()
+                finally:
+                    self._active_stream = None
+
+            # Process response content (text was already streamed above)
+            events, tool_calls_to_process = self._collect_response_blocks(response)
+            for event in events:
+                yield event
 
             # If no tool calls, we're done
             if not tool_calls_to_process:
                 break
 
-            # Process tool calls
-            tool_results = []
-            for tool_call in tool_calls_to_process:
-                result = self._handle_tool_call(tool_call.name, tool_call.input)
+            # Process tool calls (independent calls run concurrently)
+            results_by_id = self._execute_tool_calls(tool_calls_to_process)
+            for event in self._record_tool_results(tool_calls_to_process, results_by_id):
+                yield event
 
-                # Yield tool result
-                yield {
-                    "type": "tool_result",
-                    "tool_name": tool_call.name,
-                    "result": result,
-                }
+            # Check if we should stop (end_turn) or continue
+            # The model signaled it has nothing more to say after these
+            # tools ran — skip the follow-up API round-trip entirely
+            if response.stop_reason in ("end_turn", "stop_sequence"):
+                break
 
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": tool_call.id,
-                    "content": json.dumps(result, default=str),
-                })
+        yield {"type": "done"}
 
-            # Add tool results to history
-            self.messages.append({"role": "user", "content": tool_results})
+    async def chat_async(self, user_message: str) -> AsyncGenerator[dict, None]:
+        """
+        Async variant of chat() for event-loop callers.
 
-            # Check if we should stop (end_turn) or continue
-            if response.stop_reason == "end_turn":
+        Uses the async Anthropic client so network I/O overlaps with other
+        sessions on the same loop, and fans tool execution out with
+        asyncio.gather. Yields the same chunk types as chat().
+
+        Args:
+            user_message: The user's natural language query
+
+        Yields:
+            Response chunks with type indicators (text, tool_use, tool_result, etc.)
+        """
+        self.messages.append({"role": "user", "content": user_message})
+
+        # Keep the resent history bounded before calling the model
+        self._compact_history()
+
+        while True:
+            self._mark_history_cache_breakpoint()
+
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                system=self.system_blocks,
+                tools=self.tools,
+                messages=self.messages,
+            ) as stream:
+                async for delta in stream.text_stream:
+                    yield {"type": "text", "content": delta}
+                response = await stream.get_final_message()
+
+            events, tool_calls_to_process = self._collect_response_blocks(response)
+            for event in events:
+                yield event
+
+            if not tool_calls_to_process:
+                break
+
+            results_by_id = await self._execute_tool_calls_async(tool_calls_to_process)
+            for event in self._record_tool_results(tool_calls_to_process, results_by_id):
+                yield event
+
+            # The model signaled it has nothing more to say after these
+            # tools ran — skip the follow-up API round-trip entirely
+            if response.stop_reason in ("end_turn", "stop_sequence"):
                 break
 
         yield {"type": "done"}
 
-    def chat_sync(self, user_message: str) -> dict:
+    def _collect_response_blocks(self, response) -> tuple[list[dict], list]:
+        """
+        Append the assistant response to history and split it into
+        yieldable events and tool calls still to be executed.
+        """
+        self.messages.append({
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": block.text}
+                if block.type == "text"
+                else {
+                    "type": "tool_use",
+                    "id": block.id,
+                    "name": block.name,
+                    "input": block.input,
+                }
+                for block in response.content
+            ],
+        })
+
+        tool_calls = [block for block in response.content if block.type == "tool_use"]
+        events = [
+            {"type": "tool_use", "tool_name": block.name, "tool_input": block.input}
+            for block in tool_calls
+        ]
+        return events, tool_calls
+
+    def _record_tool_results(
+        self, tool_calls: list, results_by_id: dict[str, Any]
+    ) -> Generator[dict, None, None]:
+        """Append tool results to history, yielding one event per result."""
+        self.messages.append({
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_call.id,
+                    "content": _serialize_tool_result(
+                        self._model_view(tool_call.name, results_by_id[tool_call.id])
+                    ),
+                }
+                for tool_call in tool_calls
+            ],
+        })
+
+        for tool_call in tool_calls:
+            yield {
+                "type": "tool_result",
+                "tool_name": tool_call.name,
+                "result": results_by_id[tool_call.id],
+            }
+
+    def chat_sync(self, user_message: str, use_cache: bool = True) -> dict:
         """
         Process a user message and return the complete response.
 
+        Repeated questions asked in the same conversation context are
+        served from the response cache, skipping the Claude call and all
+        tool round-trips. Pass use_cache=False to force a fresh run.
+
         Args:
             user_message: The user's natural language query
+            use_cache: Whether to consult/populate the response cache
 
         Returns:
             Complete response with all text, tool uses, and results
         """
+        cache_key = None
+        if use_cache:
+            cache_key = ResponseCache.make_key(user_message, str(self.messages))
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         response = {
-            "text_parts": [],
             "tool_calls": [],
             "visualizations": [],
             "query_results": None,
             "exports": [],
         }
 
+        # Accumulate streamed text deltas in one buffer instead of a
+        # per-delta list that join() would walk again at the end
+        text_buffer = io.StringIO()
+
         for chunk in self.chat(user_message):
             if chunk["type"] == "text":
-                response["text_parts"].append(chunk["content"])
+                text_buffer.write(chunk["content"])
 
             elif chunk["type"] == "tool_use":
                 response["tool_calls"].append({
@@ -237,7 +658,11 @@ class HealthcareDataAgent:
                 elif tool_name == "export_results" and "data" in result:
                     response["exports"].append(result)
 
-        response["full_text"] = "\n".join(response["text_parts"])
+        response["full_text"] = text_buffer.getvalue()
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response)
+
         return response
 
     def get_data_dictionary(self) -> DataDictionary:
@@ -248,9 +673,23 @@ class HealthcareDataAgent:
         """Get a formatted schema description for context."""
         return self.data_dictionary.to_llm_context()
 
+    def cancel(self):
+        """
+        Abort any in-flight streaming request.
+
+        Safe to call from another thread (e.g. a watchdog timer); the
+        consuming chat() loop sees the stream end and raises/returns.
+        """
+        stream = self._active_stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
     def reset_conversation(self):
-        """Reset the conversation history."""
-        self.messages = []
+        """Reset the conversation history (the pinned schema prefix stays)."""
+        self.messages = list(self._pinned_messages)
         self.last_query_results = None
         self.pending_sql = None
 
@@ -1,5 +1,7 @@
 """System prompts for the healthcare data explorer agent."""
 
+import functools
+
 # Base system prompt (data dictionary context will be injected)
 SYSTEM_PROMPT_BASE = """You are an expert data analyst assistant for the Anthropic Health Data Collaborative (AHDC) database. AHDC maintains public health datasets on disease burden, intervention effectiveness, and health outcomes across 60+ countries. This data is used by researchers, policymakers, and global health organizations to make decisions that affect millions of people.
 
@@ -70,32 +72,47 @@ When answering questions:
 4. Present results with appropriate visualizations
 5. Provide clear insights and interpretation
 6. Suggest follow-up questions the user might want to explore
+"""
 
----
 
-## DATA DICTIONARY
+def build_system_prompt() -> str:
+    """
+    Return the guidelines-only system prompt.
 
-{data_dictionary}
-"""
+    The data dictionary is delivered separately as a pinned, cache-marked
+    user message (see HealthcareDataAgent), so guideline edits no longer
+    invalidate the provider's cached schema block.
+
+    Returns:
+        Complete system prompt string
+    """
+    return SYSTEM_PROMPT_BASE
 
 
-def build_system_prompt(data_dictionary_context: str) -> str:
+@functools.lru_cache(maxsize=8)
+def build_data_dictionary_message(data_dictionary_context: str) -> str:
     """
-    Build the complete system prompt with data dictionary context.
+    Build the data-dictionary block pinned at the start of the conversation.
+
+    Memoized on the context string: agents created for the same schema
+    (one per session in the web app) reuse the identical, byte-stable text.
 
     Args:
         data_dictionary_context: Formatted data dictionary from DataDictionary.to_llm_context()
 
     Returns:
-        Complete system prompt string
+        Formatted data dictionary message text
     """
-    return SYSTEM_PROMPT_BASE.format(data_dictionary=data_dictionary_context)
+    return f"## DATA DICTIONARY\n\n{data_dictionary_context}"
 
 
-# Legacy constant for backwards compatibility (uses placeholder)
-SYSTEM_PROMPT = SYSTEM_PROMPT_BASE.format(
-    data_dictionary="[Data dictionary will be injected at runtime]"
-)
+def __getattr__(name: str) -> str:
+    # Legacy constant for backwards compatibility. Computed lazily
+    # (PEP 562) so importing this module doesn't pay for a multi-KB
+    # string nobody may read.
+    if name == "SYSTEM_PROMPT":
+        return SYSTEM_PROMPT_BASE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 CLARIFICATION_PROMPT = """Based on the user's question, I need some clarification to provide the most useful analysis:
@@ -0,0 +1,59 @@
+"""Response cache for repeated user queries."""
+
+import copy
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+
+class ResponseCache:
+    """
+    Exact-match cache of complete chat responses.
+
+    Keys combine the user message with a hash of the conversation prefix,
+    so a hit is only possible when the same question is asked in the same
+    context — the dashboard case where many users re-run the canonical
+    "baseline / per-capita" queries. A hit skips the entire Claude call
+    and all tool round-trips.
+
+    Entries are kept LRU up to ``max_entries``. Embedding-based
+    near-duplicate lookup can be layered on top later; exact matching
+    covers the dominant repeated-query case without any extra model calls
+    or dependencies.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(user_message: str, context: str = "") -> str:
+        """Build a cache key from the user message and conversation context."""
+        digest = hashlib.sha256()
+        digest.update(user_message.encode())
+        digest.update(b"\x00")
+        digest.update(context.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Look up a cached response, returning a copy on hit."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, response: dict):
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = copy.deepcopy(response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._entries.clear()
@@ -1,12 +1,19 @@
 """Streamlit frontend for the Healthcare Data Explorer."""
 
+import asyncio
+import hashlib
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 
 import pandas as pd
 import plotly.io as pio
 import streamlit as st
 
 from agent.orchestrator import HealthcareDataAgent
+from database.connection import DatabaseConnection
 from database.data_dictionary import get_data_dictionary, DataDictionary
 from tools.visualization import VisualizationTool
 
@@ -19,8 +26,12 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS - narrower sidebar and improved styling
-st.markdown("""
+# Custom CSS - narrower sidebar and improved styling. Kept as a module
+# constant so the literal is built once at import; it must still be
+# emitted on every script run because Streamlit drops elements that are
+# not re-rendered, so "inject once per session" would lose the styling
+# on the second rerun.
+_APP_CSS = """
 <style>
     /* Narrower sidebar */
     [data-testid="stSidebar"] {
@@ -69,19 +80,21 @@ st.markdown("""
         margin-top: 1.5rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_APP_CSS, unsafe_allow_html=True)
 
 
 def init_session_state():
     """Initialize session state variables."""
     if "agent" not in st.session_state:
         st.session_state.agent = None
-    if "data_dictionary" not in st.session_state:
-        st.session_state.data_dictionary = None
     if "messages" not in st.session_state:
         st.session_state.messages = []
     if "all_query_results" not in st.session_state:
-        st.session_state.all_query_results = []  # Store ALL query results
+        # Results keyed by a hash of the SQL so repeats are stored once;
+        # bounded to MAX_STORED_RESULTS entries (oldest evicted first)
+        st.session_state.all_query_results = OrderedDict()
     if "visualizations" not in st.session_state:
         st.session_state.visualizations = []
     if "show_data_dictionary" not in st.session_state:
@@ -92,11 +105,33 @@ def init_session_state():
         st.session_state.pending_query = None
 
 
+@st.cache_data(show_spinner="Loading schema...", persist="disk")
+def _cached_data_dictionary(db_mtime: float) -> DataDictionary:
+    """
+    Build the data dictionary once and persist it to Streamlit's disk
+    cache, keyed on the SQLite file's mtime so a data reload (and nothing
+    else) invalidates it. Process restarts become a single file read.
+    """
+    return get_data_dictionary()
+
+
 def get_data_dict() -> DataDictionary:
-    """Get or create the data dictionary (generated ONCE)."""
-    if st.session_state.data_dictionary is None:
-        st.session_state.data_dictionary = get_data_dictionary()
-    return st.session_state.data_dictionary
+    """Get the data dictionary (generated ONCE per database version)."""
+    db_path = DatabaseConnection.DEFAULT_DB_PATH
+    db_mtime = os.path.getmtime(db_path) if db_path.exists() else 0.0
+    return _cached_data_dictionary(db_mtime)
+
+
+@st.cache_data(show_spinner=False)
+def _dictionary_json(schema_hash: str, _dd: DataDictionary) -> str:
+    """JSON payload for dictionary downloads, serialized once per schema."""
+    return _dd.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def _dictionary_markdown(schema_hash: str, _dd: DataDictionary) -> str:
+    """Markdown payload for dictionary downloads, rendered once per schema."""
+    return _dd.to_markdown()
 
 
 def get_agent() -> HealthcareDataAgent:
@@ -114,6 +149,38 @@ def get_agent() -> HealthcareDataAgent:
     return st.session_state.agent
 
 
+@st.cache_data(show_spinner=False)
+def _column_table(table_id: str, _table) -> pd.DataFrame:
+    """
+    Column overview DataFrame for one table.
+
+    Built column-wise (one array per DataFrame column) and cached on a
+    stable id so dtype inference and string joins run once per schema
+    instead of on every rerun of the dialog.
+    """
+    names, types, descs, distincts, samples = [], [], [], [], []
+    for col in _table.columns:
+        sample = ", ".join(str(v) for v in col.sample_values[:3])
+        if len(col.sample_values) > 3:
+            sample += "..."
+        names.append(col.name + (" 🔑" if col.primary_key else ""))
+        types.append(col.data_type)
+        descs.append(col.description)
+        if col.distinct_count and col.distinct_count > DataDictionary.DISTINCT_COUNT_CAP:
+            distincts.append(f"{DataDictionary.DISTINCT_COUNT_CAP}+")
+        else:
+            distincts.append(col.distinct_count or "-")
+        samples.append(sample)
+    return pd.DataFrame({
+        "Column": names,
+        "Type": types,
+        "Description": descs,
+        "Distinct": distincts,
+        "Sample Values": samples,
+    })
+
+
+@st.fragment
 def render_data_dictionary_dialog():
     """Render the data dictionary in a dialog/modal."""
     data_dict = get_data_dict()
@@ -123,40 +190,25 @@ def render_data_dictionary_dialog():
     st.markdown("---")
 
     # Summary metrics
-    total_rows = sum(t.row_count for t in data_dict.tables)
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Tables", len(data_dict.tables))
     with col2:
-        st.metric("Total Rows", f"{total_rows:,}")
+        st.metric("Total Rows", f"{data_dict.total_rows:,}")
     with col3:
         st.metric("Version", data_dict.version)
 
     st.markdown("---")
 
     # Table tabs
-    table_names = [t.name for t in data_dict.tables]
-    tabs = st.tabs(table_names)
+    tabs = st.tabs(data_dict.table_names)
 
     for tab, table in zip(tabs, data_dict.tables):
         with tab:
             st.markdown(f"**{table.description}**")
             st.markdown(f"📊 **{table.row_count:,}** rows")
 
-            col_data = []
-            for col in table.columns:
-                samples = ", ".join(str(v) for v in col.sample_values[:3])
-                if len(col.sample_values) > 3:
-                    samples += "..."
-                col_data.append({
-                    "Column": col.name + (" 🔑" if col.primary_key else ""),
-                    "Type": col.data_type,
-                    "Description": col.description,
-                    "Distinct": col.distinct_count or "-",
-                    "Sample Values": samples,
-                })
-
-            df = pd.DataFrame(col_data)
+            df = _column_table(f"{data_dict.schema_hash}:{table.name}", table)
             st.dataframe(df, use_container_width=True, hide_index=True)
 
     # Download options
@@ -165,7 +217,7 @@ def render_data_dictionary_dialog():
     with col1:
         st.download_button(
             "📥 Download as JSON",
-            data_dict.to_json(),
+            lambda: _dictionary_json(data_dict.schema_hash, data_dict),
             "data_dictionary.json",
             "application/json",
             use_container_width=True,
@@ -173,7 +225,7 @@ def render_data_dictionary_dialog():
     with col2:
         st.download_button(
             "📥 Download as Markdown",
-            data_dict.to_markdown(),
+            lambda: _dictionary_markdown(data_dict.schema_hash, data_dict),
             "data_dictionary.md",
             "text/markdown",
             use_container_width=True,
@@ -188,7 +240,7 @@ def render_db_overview_popup():
     for table in data_dict.tables:
         with st.expander(f"📋 {table.name}", expanded=False):
             st.caption(f"{table.row_count:,} rows")
-            st.markdown(f"*{table.description[:100]}...*" if len(table.description) > 100 else f"*{table.description}*")
+            st.markdown(f"*{table.short_description}*")
             cols = [col.name for col in table.columns]
             st.code(", ".join(cols), language=None)
 
@@ -196,7 +248,7 @@ def render_db_overview_popup():
     st.markdown("---")
     st.download_button(
         "📥 Export Schema (JSON)",
-        data_dict.to_json(),
+        lambda: _dictionary_json(data_dict.schema_hash, data_dict),
         "schema.json",
         "application/json",
         use_container_width=True,
@@ -204,16 +256,22 @@ def render_db_overview_popup():
     )
 
 
+@st.fragment
 def render_sidebar():
-    """Render the sidebar with controls."""
+    """Render the sidebar with controls.
+
+    Runs as a fragment so the overview toggle and history expander rerun
+    only the sidebar, not the whole page.
+    """
     data_dict = get_data_dict()
 
     with st.sidebar:
         st.title("🏥 AHDC Explorer")
 
         # Database overview toggle button
-        total_rows = sum(t.row_count for t in data_dict.tables)
-        st.caption(f"{len(data_dict.tables)} tables • {total_rows:,} rows")
+        st.caption(
+            f"{len(data_dict.tables)} tables • {data_dict.total_rows:,} rows"
+        )
 
         if st.button("📊 Database Overview", use_container_width=True, type="secondary"):
             st.session_state.show_db_overview = not st.session_state.show_db_overview
@@ -228,7 +286,7 @@ def render_sidebar():
         # Controls
         if st.button("🔄 New Conversation", use_container_width=True):
             st.session_state.messages = []
-            st.session_state.all_query_results = []
+            st.session_state.all_query_results = OrderedDict()
             st.session_state.visualizations = []
             st.session_state.pending_query = None
             if st.session_state.agent:
@@ -248,15 +306,25 @@ def render_sidebar():
         st.caption("Powered by Claude & AHDC")
 
 
+@st.cache_resource(show_spinner=False)
+def _figure_from_json(figure_json: str):
+    """Parse a Plotly figure JSON payload once; reruns reuse the object."""
+    return pio.from_json(figure_json)
+
+
+# Matches any number of newlines (including zero) before a markdown heading
+_HEADING_RE = re.compile(r'(?<=.)(\n*)(#{1,6}\s)')
+
+
 def format_markdown_response(text: str) -> str:
     """Fix common markdown formatting issues in responses."""
-    import re
+    # Called per streamed chunk, so skip the regex scan when there is
+    # nothing it could match
+    if "#" not in text:
+        return text
 
     # Ensure exactly one blank line before markdown headings
-    # Matches any number of newlines (including zero) before a heading and normalizes to two
-    text = re.sub(r'(?<=.)(\n*)(#{1,6}\s)', r'\n\n\2', text)
-
-    return text
+    return _HEADING_RE.sub(r'\n\n\2', text)
 
 
 def render_chat_message(message: dict):
@@ -282,7 +350,7 @@ def render_chat_message(message: dict):
                         st.markdown(f"**SQL Query {i+1}:**")
                         st.code(sql, language="sql")
                 if "visualization" in content:
-                    fig = pio.from_json(content["visualization"])
+                    fig = _figure_from_json(content["visualization"])
                     st.plotly_chart(fig, width="stretch", key="chat_viz")
                 if "insights" in content:
                     st.markdown("**Key Insights:**")
@@ -290,12 +358,49 @@ def render_chat_message(message: dict):
                         st.markdown(f"• {insight['finding']}")
 
 
-def render_query_results(results_list: list):
-    """Render all query results with data tables and export options."""
+@st.cache_data(show_spinner=False)
+def _result_dataframe(query: str, row_count: int, _rows: list) -> pd.DataFrame:
+    """
+    DataFrame for a query result, cached on the SQL text and row count.
+
+    Goes through Arrow so the row dicts are transposed in C and pandas
+    gets zero-copy columnar construction instead of re-inferring dtypes
+    from Python objects row by row.
+    """
+    import pyarrow as pa
+
+    try:
+        return pa.Table.from_pylist(_rows).to_pandas()
+    except pa.ArrowInvalid:
+        # Mixed-type columns that Arrow cannot unify fall back to pandas
+        return pd.DataFrame(_rows)
+
+
+@st.cache_data(show_spinner=False)
+def _result_csv(query: str, row_count: int, _rows: list) -> str:
+    """CSV payload for the download button, computed once per query."""
+    return _result_dataframe(query, row_count, _rows).to_csv(index=False)
+
+
+@st.cache_data(show_spinner=False)
+def _result_json(query: str, row_count: int, _rows: list) -> str:
+    """JSON payload for the download button, computed once per query."""
+    return _result_dataframe(query, row_count, _rows).to_json(
+        orient="records", indent=2
+    )
+
+
+@st.fragment
+def render_query_results(results_list: OrderedDict):
+    """Render all query results with data tables and export options.
+
+    A fragment, so download-button clicks rerun just this block instead of
+    re-rendering the chat history and every other section.
+    """
     if not results_list:
         return
 
-    for idx, results in enumerate(results_list):
+    for idx, results in enumerate(results_list.values()):
         if not results or not results.get("success"):
             continue
 
@@ -314,28 +419,59 @@ def render_query_results(results_list: list):
         with st.expander("View SQL Query", expanded=False):
             st.code(results["query"], language="sql")
 
-        # Data table
+        # Data table (DataFrame and export payloads are cached per query,
+        # not rebuilt on every widget-driven rerun)
         if results.get("data"):
-            df = pd.DataFrame(results["data"])
-            st.dataframe(df, use_container_width=True, height=min(400, 50 + len(df) * 35))
+            df = _result_dataframe(
+                results["query"], results["row_count"], results["data"]
+            )
+            # Ship at most DISPLAY_PAGE_ROWS rows to the browser; the
+            # dataframe widget gets sluggish beyond a few thousand rows.
+            # Paging reruns only this fragment, and downloads still use
+            # the full result
+            if len(df) > DISPLAY_PAGE_ROWS:
+                offset = st.number_input(
+                    "Row offset",
+                    min_value=0,
+                    max_value=len(df) - 1,
+                    step=DISPLAY_PAGE_ROWS,
+                    key=f"row_offset_{idx}",
+                )
+                view = df.iloc[offset:offset + DISPLAY_PAGE_ROWS]
+                st.caption(
+                    f"Showing rows {offset + 1:,}–"
+                    f"{min(offset + DISPLAY_PAGE_ROWS, len(df)):,}"
+                    f" of {len(df):,}"
+                )
+                st.dataframe(view, use_container_width=True, height=400)
+            else:
+                st.dataframe(
+                    df,
+                    use_container_width=True,
+                    height=400 if len(df) > 10 else None,
+                )
 
-            # Export options
+            # Export options. Payloads are generated lazily: the callable
+            # runs only when the button is clicked, so reruns never pay
+            # for serializing results nobody downloads
             col1, col2 = st.columns(2)
             with col1:
-                csv = df.to_csv(index=False)
                 st.download_button(
                     "📥 Download CSV",
-                    csv,
+                    lambda r=results: _result_csv(
+                        r["query"], r["row_count"], r["data"]
+                    ),
                     f"query_results_{idx + 1}.csv",
                     "text/csv",
                     use_container_width=True,
                     key=f"csv_download_{idx}"
                 )
             with col2:
-                json_str = df.to_json(orient="records", indent=2)
                 st.download_button(
                     "📥 Download JSON",
-                    json_str,
+                    lambda r=results: _result_json(
+                        r["query"], r["row_count"], r["data"]
+                    ),
                     f"query_results_{idx + 1}.json",
                     "application/json",
                     use_container_width=True,
@@ -345,34 +481,55 @@ def render_query_results(results_list: list):
         st.markdown("---")
 
 
-def auto_create_visualizations(data: list):
-    """Automatically create visualizations for query results."""
+@st.cache_data(show_spinner=False)
+def _suggest_charts(data_fp: str, _data: list) -> list:
+    """Chart suggestions for a result set, cached on its fingerprint."""
+    return VisualizationTool().suggest_charts(_data)
+
+
+@st.cache_data(show_spinner=False)
+def _create_chart(
+    data_fp: str, chart_type: str, x, y, color, title, _data: list
+) -> dict:
+    """Build one chart, cached on the data fingerprint and chart spec."""
+    return VisualizationTool().create_chart(
+        _data, chart_type=chart_type, x=x, y=y, color=color, title=title
+    )
+
+
+def auto_create_visualizations(data: list, data_fp: str):
+    """Automatically create visualizations for query results.
+
+    Suggestions and figures are cached on the result fingerprint, so
+    re-visualizing the same result set is a lookup instead of fresh
+    pandas passes and Plotly figure builds.
+    """
     if not data:
         return
 
-    viz_tool = VisualizationTool()
-
     # Get chart suggestions (up to 5)
-    suggestions = viz_tool.suggest_charts(data)
+    suggestions = _suggest_charts(data_fp, data)
 
     if not suggestions:
         return
 
     # Create all suggested charts
     for suggestion in suggestions:
-        chart_result = viz_tool.create_chart(
+        chart_result = _create_chart(
+            data_fp,
+            suggestion["chart_type"],
+            suggestion.get("x"),
+            suggestion.get("y"),
+            suggestion.get("color"),
+            suggestion.get("rationale", f"{suggestion['chart_type'].title()} Chart"),
             data,
-            chart_type=suggestion["chart_type"],
-            x=suggestion.get("x"),
-            y=suggestion.get("y"),
-            color=suggestion.get("color"),
-            title=suggestion.get("rationale", f"{suggestion['chart_type'].title()} Chart")
         )
 
         if chart_result.get("success"):
             st.session_state.visualizations.append(chart_result)
 
 
+@st.fragment
 def render_visualizations(visualizations: list):
     """Render Plotly visualizations."""
     if not visualizations:
@@ -383,12 +540,85 @@ def render_visualizations(visualizations: list):
     for i, viz in enumerate(visualizations):
         if viz.get("success") and viz.get("figure_json"):
             try:
-                fig = pio.from_json(viz["figure_json"])
+                fig = _figure_from_json(viz["figure_json"])
                 st.plotly_chart(fig, width="stretch", key=f"viz_{i}")
             except Exception as e:
                 st.error(f"Error rendering visualization: {e}")
 
 
+# Seconds without a streamed chunk before the in-flight request is aborted
+STREAM_IDLE_TIMEOUT = 30.0
+
+# Upper bound on query results retained in session state
+MAX_STORED_RESULTS = 20
+
+# Rows shipped to the browser per result table; paging covers the rest
+DISPLAY_PAGE_ROWS = 1000
+
+
+def _result_key(result: dict) -> str:
+    """Stable content key for a query result, derived from its SQL text."""
+    return hashlib.blake2b(
+        result.get("query", "").encode(), digest_size=8
+    ).hexdigest()
+
+
+def _store_query_result(result: dict):
+    """
+    Store a query result in session state, deduplicated by SQL text.
+
+    Re-running the same query overwrites (and refreshes) its slot instead
+    of appending, and the oldest entries are evicted past
+    MAX_STORED_RESULTS so long conversations keep bounded render cost.
+    """
+    results = st.session_state.all_query_results
+    key = _result_key(result)
+    results[key] = result
+    results.move_to_end(key)
+    while len(results) > MAX_STORED_RESULTS:
+        results.popitem(last=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide event loop on a daemon thread for async agent I/O."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(
+        target=loop.run_forever, daemon=True, name="agent-io-loop"
+    ).start()
+    return loop
+
+
+def _iter_async_chat(agent: HealthcareDataAgent, query: str):
+    """
+    Drive agent.chat_async on the background loop, yielding chunks back to
+    the synchronous Streamlit script thread.
+
+    Running the async variant lets independent tool calls within one model
+    turn execute concurrently (asyncio.gather in the orchestrator) instead
+    of serially blocking the script thread. The per-chunk wait doubles as
+    the dead-man timeout for a stalled stream.
+    """
+    loop = _background_loop()
+    gen = agent.chat_async(query)
+    try:
+        while True:
+            future = asyncio.run_coroutine_threadsafe(gen.__anext__(), loop)
+            try:
+                chunk = future.result(timeout=STREAM_IDLE_TIMEOUT)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                future.cancel()
+                raise TimeoutError(
+                    f"No response from the model for {STREAM_IDLE_TIMEOUT:.0f}s"
+                )
+            yield chunk
+    finally:
+        # Best-effort cleanup of the async generator on the loop thread
+        asyncio.run_coroutine_threadsafe(gen.aclose(), loop)
+
+
 def process_user_query(query: str):
     """Process a user query through the agent."""
     agent = get_agent()
@@ -396,16 +626,23 @@ def process_user_query(query: str):
     # Create placeholder for streaming response
     with st.chat_message("assistant"):
         response_placeholder = st.empty()
-        full_response = ""
+        # Accumulate chunks in a list (join on render) instead of
+        # quadratic string concatenation over the growing response
+        chunks: list[str] = []
+        last_render = 0.0
         sql_queries = []  # Track all SQL queries
 
         try:
-            for chunk in agent.chat(query):
+            for chunk in _iter_async_chat(agent, query):
                 if chunk["type"] == "text":
-                    full_response += chunk["content"]
-                    # Apply formatting and show with cursor
-                    formatted = format_markdown_response(full_response)
-                    response_placeholder.markdown(formatted + "▌")
+                    chunks.append(chunk["content"])
+                    # Throttle re-renders to ~20 Hz; each one reformats
+                    # and re-sends the whole buffer
+                    now = time.monotonic()
+                    if now - last_render > 0.05:
+                        formatted = format_markdown_response("".join(chunks))
+                        response_placeholder.markdown(formatted + "▌")
+                        last_render = now
 
                 elif chunk["type"] == "tool_use":
                     tool_name = chunk["tool_name"]
@@ -422,25 +659,29 @@ def process_user_query(query: str):
 
                     # Store ALL query results and auto-generate visualizations
                     if tool_name == "execute_sql" and result.get("success"):
-                        st.session_state.all_query_results.append(result)
+                        _store_query_result(result)
                         # Auto-generate visualizations for the results
                         if result.get("data"):
-                            auto_create_visualizations(result["data"])
+                            auto_create_visualizations(
+                                result["data"], _result_key(result)
+                            )
 
                     elif tool_name == "create_chart" and result.get("success"):
                         st.session_state.visualizations.append(result)
 
                 elif chunk["type"] == "done":
                     # Final render without cursor
-                    formatted = format_markdown_response(full_response)
+                    formatted = format_markdown_response("".join(chunks))
                     response_placeholder.markdown(formatted)
 
         except Exception as e:
             st.error(f"Error processing query: {e}")
-            full_response = f"I encountered an error: {str(e)}"
+            chunks = [f"I encountered an error: {str(e)}"]
 
     # Add assistant response to messages
-    st.session_state.messages.append({"role": "assistant", "content": full_response})
+    st.session_state.messages.append(
+        {"role": "assistant", "content": "".join(chunks)}
+    )
 
 
 def main():
@@ -491,7 +732,7 @@ def main():
         st.session_state.pending_query = None
 
         # Clear previous results
-        st.session_state.all_query_results = []
+        st.session_state.all_query_results = OrderedDict()
         st.session_state.visualizations = []
 
         # Show user message immediately
@@ -517,7 +758,7 @@ def main():
     # Chat input
     if prompt := st.chat_input("Ask a question about global health data..."):
         # Clear previous results for new query
-        st.session_state.all_query_results = []
+        st.session_state.all_query_results = OrderedDict()
         st.session_state.visualizations = []
 
         # Show user message immediately
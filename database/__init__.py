@@ -1,4 +1,4 @@
-from .connection import DatabaseConnection
+from .connection import DatabaseConnection, get_db
 from .data_dictionary import DataDictionary, get_data_dictionary
 
-__all__ = ["DatabaseConnection", "DataDictionary", "get_data_dictionary"]
+__all__ = ["DatabaseConnection", "DataDictionary", "get_data_dictionary", "get_db"]
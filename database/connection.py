@@ -1,12 +1,14 @@
 """Database connection management with read-only enforcement."""
 
+import re
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
 
 
 class DatabaseConnection:
@@ -26,17 +28,40 @@ class DatabaseConnection:
         self.timeout = timeout
         self.row_limit = row_limit
         self._engine: Optional[Engine] = None
+        # Schema metadata is static for a read-only database, so
+        # introspection results are cached until invalidate() is called
+        self._table_names: Optional[list[str]] = None
+        self._schema_cache: dict[str, list[dict]] = {}
+        self._row_count_cache: dict[str, int] = {}
 
     @property
     def engine(self) -> Engine:
-        """Lazy-load SQLAlchemy engine."""
+        """Lazy-load SQLAlchemy engine (one shared SQLite handle)."""
         if self._engine is None:
             self._engine = create_engine(
                 f"sqlite:///{self.db_path}",
-                connect_args={"timeout": self.timeout},
+                poolclass=StaticPool,
+                connect_args={
+                    "timeout": self.timeout,
+                    "check_same_thread": False,
+                    # Larger driver-side statement cache so repeated query
+                    # shapes stay prepared across calls
+                    "cached_statements": 256,
+                },
             )
+            event.listens_for(self._engine, "connect")(self._configure_connection)
         return self._engine
 
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        """Apply read-only pragmas tuned for analytical SELECT workloads."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap window
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
     @contextmanager
     def get_connection(self):
         """Get a database connection context manager."""
@@ -46,6 +71,22 @@ class DatabaseConnection:
         finally:
             conn.close()
 
+    def _push_row_limit(
+        self, sql: str, params: Optional[dict]
+    ) -> tuple[str, dict]:
+        """Wrap a SELECT so SQLite stops producing rows at the row limit.
+
+        Pushing the cap into the engine means an unbounded result set is
+        never evaluated just for Python to throw rows away. The inner
+        statement is terminated with a newline before the closing paren
+        so a trailing `-- comment` can't swallow the rest of the wrapper.
+        """
+        stripped = sql.strip().rstrip(";")
+        if re.match(r"(SELECT|WITH)\b", stripped, re.IGNORECASE):
+            sql = f"SELECT * FROM ({stripped}\n) LIMIT :__ahdc_lim"
+            params = {**(params or {}), "__ahdc_lim": self.row_limit}
+        return sql, params or {}
+
     def execute_query(self, sql: str, params: Optional[dict] = None) -> list[dict]:
         """
         Execute a read-only SQL query and return results as list of dicts.
@@ -61,22 +102,60 @@ class DatabaseConnection:
             ValueError: If query is not read-only
             TimeoutError: If query exceeds timeout
         """
+        sql, params = self._push_row_limit(sql, params)
+
         with self.get_connection() as conn:
             result = conn.execute(text(sql), params or {})
-            columns = result.keys()
-            rows = result.fetchmany(self.row_limit)
-            return [dict(zip(columns, row)) for row in rows]
+            # fetchmany stays as a guard for non-SELECT statements
+            return [dict(row) for row in result.mappings().fetchmany(self.row_limit)]
+
+    def execute_query_raw(self, sql: str, params: Optional[dict] = None) -> list:
+        """
+        Execute a read-only query and return tuple-like rows.
+
+        Skips the per-row dict construction of execute_query; callers
+        index columns by position. Intended for internal consumers
+        (introspection) that know their column order.
+        """
+        sql, params = self._push_row_limit(sql, params)
+
+        with self.get_connection() as conn:
+            result = conn.execute(text(sql), params or {})
+            return result.fetchmany(self.row_limit)
 
     def get_table_names(self) -> list[str]:
-        """Get all table names in the database."""
-        query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-        results = self.execute_query(query)
-        return [row["name"] for row in results]
+        """Get all table names in the database (cached).
+
+        SQLite-internal sqlite_* tables are excluded at the SQL level by
+        the dialect's reflection query, so callers never pay introspection
+        round-trips for them.
+        """
+        if self._table_names is None:
+            self._table_names = sorted(inspect(self.engine).get_table_names())
+        return list(self._table_names)
 
     def get_table_schema(self, table_name: str) -> list[dict]:
-        """Get column information for a table."""
-        query = f"PRAGMA table_info({table_name})"
-        return self.execute_query(query)
+        """
+        Get column information for a table (cached).
+
+        Uses SQLAlchemy reflection once per table instead of a PRAGMA
+        round-trip per call; results keep the PRAGMA table_info() shape
+        that callers already consume.
+        """
+        if table_name not in self._schema_cache:
+            columns = inspect(self.engine).get_columns(table_name)
+            self._schema_cache[table_name] = [
+                {
+                    "cid": i,
+                    "name": col["name"],
+                    "type": str(col["type"]),
+                    "notnull": 0 if col["nullable"] else 1,
+                    "dflt_value": col["default"],
+                    "pk": 1 if col.get("primary_key") else 0,
+                }
+                for i, col in enumerate(columns)
+            ]
+        return self._schema_cache[table_name]
 
     def get_table_sample(self, table_name: str, limit: int = 5) -> list[dict]:
         """Get sample rows from a table."""
@@ -84,7 +163,53 @@ class DatabaseConnection:
         return self.execute_query(query)
 
     def get_row_count(self, table_name: str) -> int:
-        """Get the number of rows in a table."""
-        query = f"SELECT COUNT(*) as count FROM {table_name}"
-        result = self.execute_query(query)
-        return result[0]["count"] if result else 0
+        """Get the number of rows in a table (cached)."""
+        if table_name not in self._row_count_cache:
+            query = f"SELECT COUNT(*) as count FROM {table_name}"
+            result = self.execute_query(query)
+            self._row_count_cache[table_name] = (
+                result[0]["count"] if result else 0
+            )
+        return self._row_count_cache[table_name]
+
+    def get_row_counts(self) -> dict[str, int]:
+        """Get row counts for all tables in one round trip (cached).
+
+        Counts for tables missing from the cache are fetched as a single
+        UNION ALL statement instead of one COUNT(*) query per table.
+        Table names come from the dialect's own reflection, so embedding
+        them in the statement is safe.
+        """
+        tables = self.get_table_names()
+        missing = [t for t in tables if t not in self._row_count_cache]
+        if missing:
+            union = " UNION ALL ".join(
+                f'SELECT \'{t}\' AS tbl, COUNT(*) AS n FROM "{t}"'
+                for t in missing
+            )
+            for tbl, count in self.execute_query_raw(union):
+                self._row_count_cache[tbl] = count
+        return {t: self._row_count_cache[t] for t in tables}
+
+    def invalidate(self):
+        """Drop cached schema metadata (for tests or after a reload)."""
+        self._table_names = None
+        self._schema_cache.clear()
+        self._row_count_cache.clear()
+
+
+# Shared connection for application-wide use (one pooled engine per process)
+_db_connection: Optional[DatabaseConnection] = None
+
+
+def get_db() -> DatabaseConnection:
+    """
+    Get the shared default DatabaseConnection.
+
+    Created once per process so Streamlit reruns and concurrent sessions
+    reuse a single pooled engine instead of reopening the database.
+    """
+    global _db_connection
+    if _db_connection is None:
+        _db_connection = DatabaseConnection()
+    return _db_connection
@@ -9,25 +9,162 @@ initialization. The artifact is then shared across all components:
 """
 
 import json
-from dataclasses import dataclass, field, asdict
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX platforms: skip cross-process locking
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json works too
+    orjson = None
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 import hashlib
 
-from database.connection import DatabaseConnection
-
-
-@dataclass
+from database.connection import DatabaseConnection, get_db
+
+
+# Field order for the columnar (struct-of-arrays) cache layout
+_COLUMN_FIELDS = (
+    "name",
+    "data_type",
+    "nullable",
+    "primary_key",
+    "description",
+    "sample_values",
+    "distinct_count",
+    "null_count",
+    "display_samples",
+)
+
+# Defaults for fields added after a cache file was written
+_COLUMN_FIELD_DEFAULTS = {"display_samples": ""}
+
+
+# Table descriptions for AHDC (module-level so hot loops read a global)
+_TABLE_DESCRIPTIONS = {
+    "disease_burden": "Global Burden of Disease data tracking deaths and Disability-Adjusted Life Years (DALYs) by cause, country, age group, sex, and year. Primary table for mortality analysis.",
+    "intervention_outcomes": "Health intervention effectiveness studies measuring baseline rates, post-intervention rates, and reduction percentages for various public health programs.",
+    "health_system_capacity": "Healthcare infrastructure metrics including physicians, nurses, hospital beds per capita, health expenditure, and Universal Health Coverage index.",
+    "immunization_coverage": "Vaccination coverage percentages by country, vaccine type, and year. Includes doses administered and target population groups.",
+    "maternal_child_health": "Maternal and child health indicators including mortality rates (maternal, infant, under-5, neonatal), skilled birth attendance, and antenatal care coverage.",
+    "infectious_disease_surveillance": "Disease outbreak and surveillance data tracking confirmed/suspected cases, deaths, case fatality rates, and outbreak status by country and time period.",
+}
+
+# Column descriptions
+_COLUMN_DESCRIPTIONS = {
+    # Common columns
+    "country": "Country name",
+    "country_code": "ISO 3-letter country code",
+    "region": "Geographic region (e.g., Sub-Saharan Africa, South Asia)",
+    "income_group": "World Bank income classification (Low, Lower middle, Upper middle, High)",
+    "year": "Calendar year of the data",
+
+    # disease_burden
+    "cause_of_death": "Specific cause of death (e.g., Malaria, HIV/AIDS, Stroke)",
+    "deaths": "Number of deaths",
+    "dalys_thousands": "Disability-Adjusted Life Years in thousands",
+    "age_group": "Age range (0-4, 5-14, 15-29, 30-44, 45-59, 60-74, 75+)",
+    "sex": "Biological sex (Male, Female)",
+    "data_source": "Data source organization",
+
+    # intervention_outcomes
+    "intervention_type": "Type of health intervention (e.g., Bed net distribution, Vaccination)",
+    "target_condition": "Health condition targeted by the intervention",
+    "baseline_rate_per_100k": "Disease rate per 100,000 before intervention",
+    "post_intervention_rate_per_100k": "Disease rate per 100,000 after intervention",
+    "reduction_percent": "Percentage reduction achieved",
+    "study_year": "Year the study was conducted",
+    "sample_size": "Number of participants in the study",
+    "confidence_interval_lower": "Lower bound of 95% confidence interval",
+    "confidence_interval_upper": "Upper bound of 95% confidence interval",
+    "study_quality": "Quality rating of the study (High, Moderate, Low)",
+
+    # health_system_capacity
+    "physicians_per_10k": "Number of physicians per 10,000 population",
+    "nurses_per_10k": "Number of nurses per 10,000 population",
+    "hospital_beds_per_10k": "Hospital beds per 10,000 population",
+    "health_expenditure_pct_gdp": "Health expenditure as percentage of GDP",
+    "health_expenditure_per_capita_usd": "Health expenditure per person in USD",
+    "out_of_pocket_pct": "Percentage of health costs paid out-of-pocket",
+    "universal_health_coverage_index": "UHC service coverage index (0-100)",
+
+    # immunization_coverage
+    "vaccine": "Vaccine type (e.g., BCG, DTP3, MCV1, Polio3)",
+    "coverage_pct": "Percentage of target population vaccinated",
+    "target_group": "Population group targeted for vaccination",
+    "doses_administered_millions": "Total doses administered in millions",
+
+    # maternal_child_health
+    "maternal_mortality_ratio": "Maternal deaths per 100,000 live births",
+    "infant_mortality_rate": "Infant deaths per 1,000 live births",
+    "under5_mortality_rate": "Under-5 deaths per 1,000 live births",
+    "neonatal_mortality_rate": "Neonatal deaths per 1,000 live births",
+    "stillbirth_rate": "Stillbirths per 1,000 total births",
+    "skilled_birth_attendance_pct": "Percentage of births attended by skilled personnel",
+    "antenatal_care_4visits_pct": "Percentage receiving 4+ antenatal visits",
+    "low_birthweight_pct": "Percentage of newborns with low birth weight",
+
+    # infectious_disease_surveillance
+    "disease": "Infectious disease name",
+    "confirmed_cases": "Number of laboratory-confirmed cases",
+    "suspected_cases": "Number of suspected/probable cases",
+    "case_fatality_rate": "Proportion of cases resulting in death",
+    "incidence_per_100k": "New cases per 100,000 population",
+    "outbreak_status": "Current status (Sporadic, Endemic, Outbreak)",
+    "month": "Month of the year (1-12)",
+}
+
+
+# Precompiled row templates: the bound .format skips re-parsing the
+# format spec on every iteration of the render loops
+_LLM_ROW = "| {name}{pk} | {dt} | {desc} | {samples} |".format
+_MD_ROW = "| {name}{pk} | `{dt}` | {nullable} | {desc} |".format
+
+
+def _sample_preview(values: list) -> str:
+    """Render up to three sample values as a comma-separated preview."""
+    preview = ", ".join(str(v) for v in values[:3])
+    if len(values) > 3:
+        preview += "..."
+    return preview
+
+
+@dataclass(frozen=True, slots=True)
 class ColumnInfo:
-    """Information about a database column."""
+    """Information about a database column.
+
+    Frozen and slotted: hundreds of these are alive per process, they are
+    read in tight formatting loops, and nothing mutates them after
+    generation, so dropping the per-instance __dict__ and guaranteeing
+    immutability are both free wins here.
+    """
     name: str
     data_type: str
     nullable: bool
     primary_key: bool
     description: str = ""
     sample_values: list = field(default_factory=list)
+    # Capped at DISTINCT_COUNT_CAP + 1: a value above the cap means
+    # "more than the cap", not an exact cardinality
     distinct_count: Optional[int] = None
     null_count: Optional[int] = None
+    # Sample preview pre-rendered at generation time for prompt/table rows
+    display_samples: str = ""
+
+
+def _make_column(field_values: dict) -> ColumnInfo:
+    """Construct a ColumnInfo, interning strings repeated across columns."""
+    field_values["data_type"] = sys.intern(field_values["data_type"] or "")
+    field_values["description"] = sys.intern(field_values["description"] or "")
+    return ColumnInfo(**field_values)
 
 
 @dataclass
@@ -42,6 +179,13 @@ class TableInfo:
     def column_names(self) -> list[str]:
         return [col.name for col in self.columns]
 
+    @cached_property
+    def short_description(self) -> str:
+        """Description truncated for compact UI listings."""
+        if len(self.description) > 100:
+            return f"{self.description[:100]}..."
+        return self.description
+
 
 @dataclass
 class DataDictionary:
@@ -60,88 +204,55 @@ class DataDictionary:
     tables: list[TableInfo]
     generated_at: str = ""
     version: str = "1.0"
+    schema_hash: str = ""
+
+    # Distinct counting stops once this many values are seen; downstream
+    # consumers only care whether a column is low-cardinality
+    DISTINCT_COUNT_CAP = 20
+
+    # Backwards-compatible aliases for the module-level description maps
+    TABLE_DESCRIPTIONS = _TABLE_DESCRIPTIONS
+    COLUMN_DESCRIPTIONS = _COLUMN_DESCRIPTIONS
+
+    @cached_property
+    def total_rows(self) -> int:
+        """Total row count across all tables, computed once per instance."""
+        return sum(t.row_count for t in self.tables)
 
-    # Table descriptions for AHDC
-    TABLE_DESCRIPTIONS = {
-        "disease_burden": "Global Burden of Disease data tracking deaths and Disability-Adjusted Life Years (DALYs) by cause, country, age group, sex, and year. Primary table for mortality analysis.",
-        "intervention_outcomes": "Health intervention effectiveness studies measuring baseline rates, post-intervention rates, and reduction percentages for various public health programs.",
-        "health_system_capacity": "Healthcare infrastructure metrics including physicians, nurses, hospital beds per capita, health expenditure, and Universal Health Coverage index.",
-        "immunization_coverage": "Vaccination coverage percentages by country, vaccine type, and year. Includes doses administered and target population groups.",
-        "maternal_child_health": "Maternal and child health indicators including mortality rates (maternal, infant, under-5, neonatal), skilled birth attendance, and antenatal care coverage.",
-        "infectious_disease_surveillance": "Disease outbreak and surveillance data tracking confirmed/suspected cases, deaths, case fatality rates, and outbreak status by country and time period.",
-    }
-
-    # Column descriptions
-    COLUMN_DESCRIPTIONS = {
-        # Common columns
-        "country": "Country name",
-        "country_code": "ISO 3-letter country code",
-        "region": "Geographic region (e.g., Sub-Saharan Africa, South Asia)",
-        "income_group": "World Bank income classification (Low, Lower middle, Upper middle, High)",
-        "year": "Calendar year of the data",
-
-        # disease_burden
-        "cause_of_death": "Specific cause of death (e.g., Malaria, HIV/AIDS, Stroke)",
-        "deaths": "Number of deaths",
-        "dalys_thousands": "Disability-Adjusted Life Years in thousands",
-        "age_group": "Age range (0-4, 5-14, 15-29, 30-44, 45-59, 60-74, 75+)",
-        "sex": "Biological sex (Male, Female)",
-        "data_source": "Data source organization",
-
-        # intervention_outcomes
-        "intervention_type": "Type of health intervention (e.g., Bed net distribution, Vaccination)",
-        "target_condition": "Health condition targeted by the intervention",
-        "baseline_rate_per_100k": "Disease rate per 100,000 before intervention",
-        "post_intervention_rate_per_100k": "Disease rate per 100,000 after intervention",
-        "reduction_percent": "Percentage reduction achieved",
-        "study_year": "Year the study was conducted",
-        "sample_size": "Number of participants in the study",
-        "confidence_interval_lower": "Lower bound of 95% confidence interval",
-        "confidence_interval_upper": "Upper bound of 95% confidence interval",
-        "study_quality": "Quality rating of the study (High, Moderate, Low)",
-
-        # health_system_capacity
-        "physicians_per_10k": "Number of physicians per 10,000 population",
-        "nurses_per_10k": "Number of nurses per 10,000 population",
-        "hospital_beds_per_10k": "Hospital beds per 10,000 population",
-        "health_expenditure_pct_gdp": "Health expenditure as percentage of GDP",
-        "health_expenditure_per_capita_usd": "Health expenditure per person in USD",
-        "out_of_pocket_pct": "Percentage of health costs paid out-of-pocket",
-        "universal_health_coverage_index": "UHC service coverage index (0-100)",
-
-        # immunization_coverage
-        "vaccine": "Vaccine type (e.g., BCG, DTP3, MCV1, Polio3)",
-        "coverage_pct": "Percentage of target population vaccinated",
-        "target_group": "Population group targeted for vaccination",
-        "doses_administered_millions": "Total doses administered in millions",
-
-        # maternal_child_health
-        "maternal_mortality_ratio": "Maternal deaths per 100,000 live births",
-        "infant_mortality_rate": "Infant deaths per 1,000 live births",
-        "under5_mortality_rate": "Under-5 deaths per 1,000 live births",
-        "neonatal_mortality_rate": "Neonatal deaths per 1,000 live births",
-        "stillbirth_rate": "Stillbirths per 1,000 total births",
-        "skilled_birth_attendance_pct": "Percentage of births attended by skilled personnel",
-        "antenatal_care_4visits_pct": "Percentage receiving 4+ antenatal visits",
-        "low_birthweight_pct": "Percentage of newborns with low birth weight",
-
-        # infectious_disease_surveillance
-        "disease": "Infectious disease name",
-        "confirmed_cases": "Number of laboratory-confirmed cases",
-        "suspected_cases": "Number of suspected/probable cases",
-        "case_fatality_rate": "Proportion of cases resulting in death",
-        "incidence_per_100k": "New cases per 100,000 population",
-        "outbreak_status": "Current status (Sporadic, Endemic, Outbreak)",
-        "month": "Month of the year (1-12)",
-    }
+    @cached_property
+    def table_names(self) -> list[str]:
+        """Names of all tables, computed once per instance."""
+        return [t.name for t in self.tables]
 
     @classmethod
-    def generate(cls, db: Optional[DatabaseConnection] = None) -> "DataDictionary":
+    def _schema_fingerprint(cls, db: DatabaseConnection) -> str:
+        """
+        Cheap fingerprint of the database: table DDL plus row counts.
+
+        Matching fingerprints mean the cached dictionary (including its
+        expensive distinct-count and sample statistics) is still valid.
+        """
+        ddl_rows = db.execute_query(
+            "SELECT sql FROM sqlite_master WHERE type='table' ORDER BY name"
+        )
+        parts = [row["sql"] or "" for row in ddl_rows]
+        for name in db.get_table_names():
+            parts.append(f"{name}={db.get_row_count(name)}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    @classmethod
+    def generate(
+        cls,
+        db: Optional[DatabaseConnection] = None,
+        cached: Optional["DataDictionary"] = None,
+    ) -> "DataDictionary":
         """
         Generate the data dictionary from the database.
 
         Args:
             db: Database connection (creates new one if not provided)
+            cached: Previous dictionary; tables whose schema and row count
+                are unchanged are copied from it instead of re-introspected
 
         Returns:
             Complete DataDictionary instance
@@ -149,60 +260,35 @@ class DataDictionary:
         import datetime
 
         if db is None:
-            db = DatabaseConnection()
+            db = get_db()
 
-        tables = []
+        # get_table_names already excludes sqlite_* internals in SQL
         table_names = db.get_table_names()
 
-        for table_name in table_names:
-            # Skip SQLite internal tables
-            if table_name.startswith("sqlite_"):
-                continue
-
-            # Get schema info
-            schema = db.get_table_schema(table_name)
-            row_count = db.get_row_count(table_name)
-
-            # Build column info
-            columns = []
-            for col in schema:
-                col_name = col["name"]
-
-                # Get sample values for categorical columns
-                sample_values = []
-                distinct_count = None
-                try:
-                    query = f"SELECT DISTINCT {col_name} FROM {table_name} WHERE {col_name} IS NOT NULL LIMIT 10"
-                    results = db.execute_query(query)
-                    sample_values = [r[col_name] for r in results]
-
-                    # Get distinct count
-                    count_query = f"SELECT COUNT(DISTINCT {col_name}) as cnt FROM {table_name}"
-                    count_result = db.execute_query(count_query)
-                    distinct_count = count_result[0]["cnt"] if count_result else None
-                except Exception:
-                    pass
-
-                column_info = ColumnInfo(
-                    name=col_name,
-                    data_type=col["type"],
-                    nullable=not col["notnull"],
-                    primary_key=bool(col["pk"]),
-                    description=cls.COLUMN_DESCRIPTIONS.get(col_name, ""),
-                    sample_values=sample_values[:5],  # Limit to 5 samples
-                    distinct_count=distinct_count,
-                )
-                columns.append(column_info)
-
-            table_info = TableInfo(
-                name=table_name,
-                description=cls.TABLE_DESCRIPTIONS.get(table_name, ""),
-                row_count=row_count,
-                columns=columns,
-            )
-            tables.append(table_info)
+        def build_table(name: str) -> TableInfo:
+            if cached is not None:
+                prev = cached.get_table(name)
+                if (
+                    prev is not None
+                    and prev.row_count == db.get_row_count(name)
+                    and [(c.name, c.data_type) for c in prev.columns]
+                    == [
+                        (c["name"], c["type"])
+                        for c in db.get_table_schema(name)
+                    ]
+                ):
+                    return prev
+            return cls._introspect_table(name, db)
+
+        # Introspect tables concurrently: SQLite releases the GIL during
+        # query execution, so independent read-only scans overlap. Each
+        # worker opens its own connection since a single handle would
+        # serialize them again.
+        with ThreadPoolExecutor(max_workers=max(1, len(table_names))) as executor:
+            tables = list(executor.map(build_table, table_names))
 
         return cls(
+            schema_hash=cls._schema_fingerprint(db),
             database_name="AHDC (Anthropic Health Data Collaborative)",
             database_description=(
                 "Global health database maintained by the Anthropic Health Data Collaborative. "
@@ -214,8 +300,97 @@ class DataDictionary:
             generated_at=datetime.datetime.now().isoformat(),
         )
 
+    @classmethod
+    def _introspect_table(
+        cls, table_name: str, shared_db: DatabaseConnection
+    ) -> TableInfo:
+        """Build TableInfo for one table on a dedicated connection."""
+        db = DatabaseConnection(
+            db_path=shared_db.db_path,
+            timeout=shared_db.timeout,
+            row_limit=shared_db.row_limit,
+        )
+
+        schema = db.get_table_schema(table_name)
+        col_names = [col["name"] for col in schema]
+
+        # Fold the row count and every distinct count into one
+        # round-trip. Each distinct count is a scalar subquery that
+        # short-circuits once DISTINCT_COUNT_CAP + 1 values are seen,
+        # so wide tables avoid full hash-set scans per column
+        cap = cls.DISTINCT_COUNT_CAP + 1
+        row_count = 0
+        distinct_counts: dict = {}
+        try:
+            distinct_parts = ", ".join(
+                f'(SELECT COUNT(*) FROM (SELECT DISTINCT "{name}" '
+                f'FROM {table_name} WHERE "{name}" IS NOT NULL '
+                f'LIMIT {cap})) AS "__dc_{i}"'
+                for i, name in enumerate(col_names)
+            )
+            stats = db.execute_query_raw(
+                f'SELECT COUNT(*) AS "__rc", {distinct_parts} FROM {table_name}'
+            )
+            if stats:
+                row_count = stats[0][0]
+                distinct_counts = {
+                    name: stats[0][i + 1]
+                    for i, name in enumerate(col_names)
+                }
+        except Exception:
+            row_count = db.get_row_count(table_name)
+
+        # One bounded scan for sample values; per-column distincts
+        # are deduplicated in Python rather than one DISTINCT query
+        # per column
+        samples: dict = {name: [] for name in col_names}
+        try:
+            # Raw tuple rows, indexed by position (SELECT * follows the
+            # schema column order)
+            sample_rows = db.execute_query_raw(
+                f"SELECT * FROM {table_name} LIMIT 200"
+            )
+            for i, name in enumerate(col_names):
+                seen = dict.fromkeys(
+                    row[i] for row in sample_rows if row[i] is not None
+                )
+                samples[name] = list(seen)[:10]
+        except Exception:
+            pass
+
+        columns = [
+            ColumnInfo(
+                name=col["name"],
+                data_type=sys.intern(col["type"]),
+                nullable=not col["notnull"],
+                primary_key=bool(col["pk"]),
+                description=_COLUMN_DESCRIPTIONS.get(col["name"], ""),
+                sample_values=samples.get(col["name"], [])[:5],
+                distinct_count=distinct_counts.get(col["name"]),
+                display_samples=_sample_preview(
+                    samples.get(col["name"], [])[:5]
+                ),
+            )
+            for col in schema
+        ]
+
+        return TableInfo(
+            name=table_name,
+            description=_TABLE_DESCRIPTIONS.get(table_name, ""),
+            row_count=row_count,
+            columns=columns,
+        )
+
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        The dictionary is immutable after generation, so the result is
+        memoized; callers must treat it as read-only.
+        """
+        return self._as_dict
+
+    @cached_property
+    def _as_dict(self) -> dict:
         return {
             "database_name": self.database_name,
             "database_description": self.database_description,
@@ -224,12 +399,18 @@ class DataDictionary:
                     "name": t.name,
                     "description": t.description,
                     "row_count": t.row_count,
-                    "columns": [asdict(c) for c in t.columns],
+                    # Columns serialize as parallel arrays (SoA) so the
+                    # cache file does not repeat the field names per column
+                    "columns": {
+                        f: [getattr(c, f) for c in t.columns]
+                        for f in _COLUMN_FIELDS
+                    },
                 }
                 for t in self.tables
             ],
             "generated_at": self.generated_at,
             "version": self.version,
+            "schema_hash": self.schema_hash,
         }
 
     def to_json(self, indent: int = 2) -> str:
@@ -237,36 +418,83 @@ class DataDictionary:
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
     def save(self, path: Path):
-        """Save data dictionary to file."""
-        path.write_text(self.to_json())
+        """Save data dictionary to file (orjson's C serializer when available).
+
+        The rendered LLM context and markdown are embedded in the cache so
+        a cold start can serve them without rebuilding the strings.
+        """
+        payload = {
+            **self.to_dict(),
+            "_rendered": {
+                "llm_context": self.to_llm_context(),
+                "markdown": self.to_markdown(),
+            },
+        }
+        if orjson is not None:
+            path.write_bytes(
+                orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            path.write_text(json.dumps(payload, indent=2, default=str))
 
     @classmethod
     def load(cls, path: Path) -> "DataDictionary":
-        """Load data dictionary from file."""
-        data = json.loads(path.read_text())
+        """Load data dictionary from file.
+
+        Reads raw bytes and parses with orjson when available, skipping
+        the intermediate UTF-8 str that read_text() would allocate.
+        """
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         tables = []
         for t in data["tables"]:
-            columns = [ColumnInfo(**c) for c in t["columns"]]
+            cols_data = t["columns"]
+            if isinstance(cols_data, dict):
+                # Columnar layout: zip the parallel arrays back into
+                # rows, defaulting arrays absent from older cache files
+                n = len(cols_data.get("name", []))
+                arrays = (
+                    cols_data.get(f, [_COLUMN_FIELD_DEFAULTS.get(f)] * n)
+                    for f in _COLUMN_FIELDS
+                )
+                columns = [
+                    _make_column(dict(zip(_COLUMN_FIELDS, values)))
+                    for values in zip(*arrays)
+                ]
+            else:
+                # Older cache files stored one dict per column
+                columns = [_make_column(dict(c)) for c in cols_data]
             tables.append(TableInfo(
                 name=t["name"],
                 description=t["description"],
                 row_count=t["row_count"],
                 columns=columns,
             ))
-        return cls(
+        instance = cls(
             database_name=data["database_name"],
             database_description=data["database_description"],
             tables=tables,
             generated_at=data.get("generated_at", ""),
             version=data.get("version", "1.0"),
+            schema_hash=data.get("schema_hash", ""),
         )
 
+        # Seed the memoized renders from the cache file so cold starts
+        # skip the string builds entirely
+        rendered = data.get("_rendered", {})
+        if rendered.get("llm_context"):
+            instance.__dict__["_llm_context"] = rendered["llm_context"]
+        if rendered.get("markdown"):
+            instance.__dict__["_markdown"] = rendered["markdown"]
+        return instance
+
+    @cached_property
+    def _table_index(self) -> dict:
+        return {t.name: t for t in self.tables}
+
     def get_table(self, name: str) -> Optional[TableInfo]:
-        """Get a specific table by name."""
-        for table in self.tables:
-            if table.name == name:
-                return table
-        return None
+        """Get a specific table by name (O(1) via a lazily built index)."""
+        return self._table_index.get(name)
 
     def to_llm_context(self) -> str:
         """
@@ -274,85 +502,107 @@ class DataDictionary:
 
         This provides the LLM with complete schema information to
         write accurate SQL queries without needing to discover the schema.
+        Rendered once and memoized since the dictionary never changes
+        after generation.
         """
-        lines = [
-            f"# {self.database_name}",
-            "",
-            self.database_description,
-            "",
-            "## Available Tables",
-            "",
-        ]
+        return self._llm_context
 
+    @cached_property
+    def _llm_context(self) -> str:
+        # One f-string block per table rather than hundreds of per-line
+        # list appends
+        blocks = []
         for table in self.tables:
-            lines.append(f"### {table.name}")
-            lines.append(f"**Description:** {table.description}")
-            lines.append(f"**Rows:** {table.row_count:,}")
-            lines.append("")
-            lines.append("| Column | Type | Description | Sample Values |")
-            lines.append("|--------|------|-------------|---------------|")
-
-            for col in table.columns:
-                samples = ", ".join(str(v) for v in col.sample_values[:3])
-                if len(col.sample_values) > 3:
-                    samples += "..."
-                pk = " (PK)" if col.primary_key else ""
-                lines.append(f"| {col.name}{pk} | {col.data_type} | {col.description} | {samples} |")
-
-            lines.append("")
+            rows = "\n".join(
+                _LLM_ROW(
+                    name=col.name,
+                    pk=" (PK)" if col.primary_key else "",
+                    dt=col.data_type,
+                    desc=col.description,
+                    samples=col.display_samples
+                    or _sample_preview(col.sample_values),
+                )
+                for col in table.columns
+            )
+            blocks.append(
+                f"### {table.name}\n"
+                f"**Description:** {table.description}\n"
+                f"**Rows:** {table.row_count:,}\n"
+                "\n"
+                "| Column | Type | Description | Sample Values |\n"
+                "|--------|------|-------------|---------------|\n"
+                f"{rows}\n"
+            )
 
-        return "\n".join(lines)
+        header = (
+            f"# {self.database_name}\n"
+            "\n"
+            f"{self.database_description}\n"
+            "\n"
+            "## Available Tables\n"
+        )
+        return header + "\n" + "\n".join(blocks)
 
     def to_markdown(self) -> str:
-        """Generate full markdown documentation."""
-        lines = [
-            f"# {self.database_name} - Data Dictionary",
-            "",
-            f"*Generated: {self.generated_at}*",
-            "",
-            "## Overview",
-            "",
-            self.database_description,
-            "",
-            f"**Total Tables:** {len(self.tables)}",
-            f"**Total Rows:** {sum(t.row_count for t in self.tables):,}",
-            "",
-            "---",
-            "",
-        ]
+        """Generate full markdown documentation (rendered once, memoized)."""
+        return self._markdown
 
+    @cached_property
+    def _markdown(self) -> str:
+        blocks = []
         for table in self.tables:
-            lines.append(f"## {table.name}")
-            lines.append("")
-            lines.append(f"> {table.description}")
-            lines.append("")
-            lines.append(f"**Row Count:** {table.row_count:,}")
-            lines.append("")
-            lines.append("### Columns")
-            lines.append("")
-            lines.append("| Column | Type | Nullable | Description |")
-            lines.append("|--------|------|----------|-------------|")
-
-            for col in table.columns:
-                nullable = "Yes" if col.nullable else "No"
-                pk = " **(PK)**" if col.primary_key else ""
-                lines.append(f"| {col.name}{pk} | `{col.data_type}` | {nullable} | {col.description} |")
-
-            lines.append("")
-
-            # Sample values section
-            lines.append("### Sample Values")
-            lines.append("")
-            for col in table.columns:
-                if col.sample_values and col.distinct_count and col.distinct_count <= 20:
-                    values = ", ".join(f"`{v}`" for v in col.sample_values)
-                    lines.append(f"- **{col.name}**: {values}")
-
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-
-        return "\n".join(lines)
+            cols = "\n".join(
+                _MD_ROW(
+                    name=col.name,
+                    pk=" **(PK)**" if col.primary_key else "",
+                    dt=col.data_type,
+                    nullable="Yes" if col.nullable else "No",
+                    desc=col.description,
+                )
+                for col in table.columns
+            )
+            samples = "\n".join(
+                f"- **{col.name}**: "
+                + ", ".join(f"`{v}`" for v in col.sample_values)
+                for col in table.columns
+                if col.sample_values
+                and col.distinct_count
+                and col.distinct_count <= 20
+            )
+            blocks.append(
+                f"## {table.name}\n"
+                "\n"
+                f"> {table.description}\n"
+                "\n"
+                f"**Row Count:** {table.row_count:,}\n"
+                "\n"
+                "### Columns\n"
+                "\n"
+                "| Column | Type | Nullable | Description |\n"
+                "|--------|------|----------|-------------|\n"
+                f"{cols}\n"
+                "\n"
+                "### Sample Values\n"
+                "\n"
+                + (f"{samples}\n" if samples else "")
+                + "\n---\n"
+            )
+
+        header = (
+            f"# {self.database_name} - Data Dictionary\n"
+            "\n"
+            f"*Generated: {self.generated_at}*\n"
+            "\n"
+            "## Overview\n"
+            "\n"
+            f"{self.database_description}\n"
+            "\n"
+            f"**Total Tables:** {len(self.tables)}\n"
+            f"**Total Rows:** {self.total_rows:,}\n"
+            "\n"
+            "---\n"
+        )
+        return header + "\n" + "\n".join(blocks)
 
 
 # Singleton instance for application-wide use
@@ -360,6 +610,20 @@ _data_dictionary: Optional[DataDictionary] = None
 _dictionary_cache_path = Path(__file__).parent / "data_dictionary_cache.json"
 
 
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive advisory lock on `path` (no-op where fcntl is unavailable)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 def get_data_dictionary(force_refresh: bool = False) -> DataDictionary:
     """
     Get the singleton data dictionary instance.
@@ -378,20 +642,48 @@ def get_data_dictionary(force_refresh: bool = False) -> DataDictionary:
         return _data_dictionary
 
     # Try to load from cache first
+    cached: Optional[DataDictionary] = None
     if _dictionary_cache_path.exists() and not force_refresh:
         try:
-            _data_dictionary = DataDictionary.load(_dictionary_cache_path)
-            return _data_dictionary
+            cached = DataDictionary.load(_dictionary_cache_path)
         except Exception:
-            pass  # Cache invalid, regenerate
+            cached = None  # Cache invalid, regenerate
 
-    # Generate fresh
-    _data_dictionary = DataDictionary.generate()
-
-    # Save to cache
-    try:
-        _data_dictionary.save(_dictionary_cache_path)
-    except Exception:
-        pass  # Non-critical if cache save fails
+    # Reuse the cache outright only when the schema fingerprint (DDL +
+    # row counts) still matches; otherwise regenerate, copying over any
+    # individual tables that are unchanged
+    if cached is not None and cached.schema_hash:
+        try:
+            if cached.schema_hash == DataDictionary._schema_fingerprint(get_db()):
+                _data_dictionary = cached
+                return _data_dictionary
+        except Exception:
+            pass
+
+    # Regenerate under an exclusive file lock so only one worker pays
+    # the introspection cost in multi-process deployments; the others
+    # block briefly, then pick up the freshly written cache
+    lock_path = _dictionary_cache_path.with_suffix(".lock")
+    with _file_lock(lock_path):
+        if not force_refresh and _dictionary_cache_path.exists():
+            # Another worker may have regenerated while we waited
+            try:
+                fresh = DataDictionary.load(_dictionary_cache_path)
+                if fresh.schema_hash and fresh.schema_hash == (
+                    DataDictionary._schema_fingerprint(get_db())
+                ):
+                    _data_dictionary = fresh
+                    return _data_dictionary
+            except Exception:
+                pass
+
+        # Generate fresh (partially from cache where tables are unchanged)
+        _data_dictionary = DataDictionary.generate(cached=cached)
+
+        # Save to cache
+        try:
+            _data_dictionary.save(_dictionary_cache_path)
+        except Exception:
+            pass  # Non-critical if cache save fails
 
     return _data_dictionary
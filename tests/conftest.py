@@ -16,27 +16,29 @@ from utils.security import SQLValidator
 @pytest.fixture
 def temp_db_path():
     """Create a temporary database file path."""
+    # Close the handle before yielding so SQLite doesn't share the path
+    # with a dangling open FD for the lifetime of the test
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        yield Path(f.name)
+        path = Path(f.name)
+    yield path
+    path.unlink(missing_ok=True)
 
 
-@pytest.fixture
-def sample_db(temp_db_path):
-    """Create a sample database with test data."""
-    conn = sqlite3.connect(temp_db_path)
+@pytest.fixture(scope="session")
+def _template_db():
+    """Build the shared sample dataset once for the whole session."""
+    conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
 
-    # Create test tables
-    cursor.execute("""
+    # Create test tables in one script call
+    conn.executescript("""
         CREATE TABLE countries (
             id INTEGER PRIMARY KEY,
             name TEXT NOT NULL,
             region TEXT NOT NULL,
             population INTEGER
-        )
-    """)
+        );
 
-    cursor.execute("""
         CREATE TABLE health_metrics (
             id INTEGER PRIMARY KEY,
             country_id INTEGER,
@@ -44,7 +46,7 @@ def sample_db(temp_db_path):
             value REAL NOT NULL,
             year INTEGER NOT NULL,
             FOREIGN KEY (country_id) REFERENCES countries(id)
-        )
+        );
     """)
 
     # Insert test data
@@ -68,21 +70,43 @@ def sample_db(temp_db_path):
     cursor.executemany("INSERT INTO health_metrics VALUES (?, ?, ?, ?, ?)", metrics)
 
     conn.commit()
+    yield conn
     conn.close()
 
-    yield temp_db_path
 
-    # Cleanup
-    temp_db_path.unlink(missing_ok=True)
+@pytest.fixture(scope="session")
+def _template_db_image(_template_db):
+    """Serialized byte image of the template database (sqlite3 3.11+)."""
+    return _template_db.serialize()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_db(tmp_path_factory, _template_db_image):
+    """Shared on-disk copy of the template database.
+
+    Session-scoped: the connection layer enforces PRAGMA query_only, so
+    no test can mutate the file and every test can safely share it.
+    Writing the serialized image is a single file write — no SQLite
+    connections or re-run DDL/inserts. Parallel workers each get their
+    own tmp_path_factory root, so this also stays contention-free under
+    pytest-xdist.
+    """
+    path = tmp_path_factory.mktemp("db") / "sample.db"
+    path.write_bytes(_template_db_image)
+    return path
+
+
+@pytest.fixture(scope="session")
 def db_connection(sample_db):
-    """Create a database connection to the sample database."""
+    """Create a database connection to the sample database.
+
+    Session-scoped so every test reuses one pooled engine and its
+    schema caches instead of reopening the database.
+    """
     return DatabaseConnection(db_path=sample_db)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def discovery_tool(db_connection):
     """Create a discovery tool instance."""
     return DiscoveryTool(db_connection)
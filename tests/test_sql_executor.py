@@ -78,6 +78,24 @@ class TestSQLExecutorTool:
         assert result["success"] is True
         assert result["row_count"] == 2
 
+    def test_execute_query_with_trailing_comment(self, sql_executor):
+        """A trailing line comment must survive the row-limit pushdown."""
+        result = sql_executor.execute_query(
+            "SELECT name FROM countries -- top rows"
+        )
+
+        assert result["success"] is True
+        assert result["row_count"] == 3
+
+    def test_row_limit_pushed_into_engine(self, db_connection):
+        """The engine-level wrapper caps rows even without an outer LIMIT."""
+        rows = db_connection.execute_query("SELECT * FROM health_metrics")
+        assert len(rows) <= db_connection.row_limit
+
+        sql, params = db_connection._push_row_limit("SELECT 1", None)
+        assert params["__ahdc_lim"] == db_connection.row_limit
+        assert sql.startswith("SELECT * FROM (")
+
     def test_validate_valid_query(self, sql_executor):
         """Test validating a valid SELECT query."""
         result = sql_executor.validate_query("SELECT * FROM countries")
@@ -56,6 +56,20 @@ class TestVisualizationTool:
         assert result["success"] is True
         assert result["chart_type"] == "bar"
         assert "figure_json" in result
+        # HTML rendering is opt-in; the default response carries JSON only
+        assert "figure_html" not in result
+
+    def test_create_chart_with_html(self, visualization_tool, sample_query_results):
+        """Test that include_html adds a standalone HTML snippet."""
+        result = visualization_tool.create_chart(
+            sample_query_results,
+            chart_type="bar",
+            x="country",
+            y="deaths",
+            include_html=True,
+        )
+
+        assert result["success"] is True
         assert "figure_html" in result
 
     def test_create_line_chart(self, visualization_tool, sample_time_series_data):
@@ -1,5 +1,6 @@
 """Database discovery tool for schema exploration."""
 
+from itertools import islice
 from typing import Any
 
 from database.connection import DatabaseConnection
@@ -8,16 +9,37 @@ from database.connection import DatabaseConnection
 class DiscoveryTool:
     """Tool for discovering and understanding database structure."""
 
+    # Tables above this row count get their distinct counts estimated
+    # from a bounded prefix scan; exact cardinality isn't worth a full
+    # multi-million-row scan for an LLM-facing schema summary
+    DISTINCT_COUNT_SCAN_CAP = 50_000
+
     def __init__(self, db: DatabaseConnection):
         self.db = db
+        # Introspection results keyed by PRAGMA schema_version, so a
+        # schema change invalidates them automatically while repeat
+        # tool calls cost zero SQL round trips
+        self._overview_cache: dict[int, dict[str, Any]] = {}
+        self._details_cache: dict[tuple[int, str], dict[str, Any]] = {}
+        self._summary_cache: dict[tuple[int, str], str] = {}
+
+    def _schema_version(self) -> int:
+        """Current PRAGMA schema_version (bumped by any DDL)."""
+        rows = self.db.execute_query_raw("PRAGMA schema_version")
+        return rows[0][0] if rows else 0
 
     def get_database_overview(self) -> dict[str, Any]:
         """
-        Get a high-level overview of the database.
+        Get a high-level overview of the database (cached per schema).
 
         Returns:
             Dictionary with database overview including tables and row counts
         """
+        version = self._schema_version()
+        cached = self._overview_cache.get(version)
+        if cached is not None:
+            return cached
+
         tables = self.db.get_table_names()
         overview = {
             "database_type": "SQLite",
@@ -25,20 +47,23 @@ class DiscoveryTool:
             "tables": {},
         }
 
+        # One UNION ALL round trip for every table's count instead of a
+        # COUNT(*) query per table
+        row_counts = self.db.get_row_counts()
         for table in tables:
-            row_count = self.db.get_row_count(table)
             schema = self.db.get_table_schema(table)
             overview["tables"][table] = {
-                "row_count": row_count,
+                "row_count": row_counts[table],
                 "column_count": len(schema),
                 "columns": [col["name"] for col in schema],
             }
 
+        self._overview_cache[version] = overview
         return overview
 
     def get_table_details(self, table_name: str) -> dict[str, Any]:
         """
-        Get detailed information about a specific table.
+        Get detailed information about a specific table (cached per schema).
 
         Args:
             table_name: Name of the table to inspect
@@ -46,37 +71,59 @@ class DiscoveryTool:
         Returns:
             Dictionary with table details including schema and sample data
         """
+        key = (self._schema_version(), table_name)
+        cached = self._details_cache.get(key)
+        if cached is not None:
+            return cached
+
         schema = self.db.get_table_schema(table_name)
         sample = self.db.get_table_sample(table_name, limit=5)
         row_count = self.db.get_row_count(table_name)
 
-        # Get column statistics
+        # All distinct counts in one table scan instead of one
+        # COUNT(DISTINCT) query (and full scan) per column. Column names
+        # come from reflection, quoted defensively. Large tables are
+        # scanned through a bounded prefix, giving an estimate instead
+        # of an O(rows) exact count
+        approximate = row_count > self.DISTINCT_COUNT_SCAN_CAP
+        source = (
+            f'(SELECT * FROM "{table_name}" LIMIT {self.DISTINCT_COUNT_SCAN_CAP})'
+            if approximate
+            else f'"{table_name}"'
+        )
+        try:
+            cols_sql = ", ".join(
+                'COUNT(DISTINCT "{}")'.format(col["name"]) for col in schema
+            )
+            counts = self.db.execute_query_raw(
+                f"SELECT {cols_sql} FROM {source}"
+            )[0]
+        except Exception:
+            counts = [None] * len(schema)
+
         columns_info = []
-        for col in schema:
-            col_info = {
+        for col, distinct_count in zip(schema, counts):
+            columns_info.append({
                 "name": col["name"],
                 "type": col["type"],
                 "nullable": not col["notnull"],
                 "primary_key": bool(col["pk"]),
                 "default": col["dflt_value"],
-            }
-
-            # Get distinct value count for non-numeric columns
-            try:
-                distinct_query = f"SELECT COUNT(DISTINCT {col['name']}) as cnt FROM {table_name}"
-                result = self.db.execute_query(distinct_query)
-                col_info["distinct_values"] = result[0]["cnt"]
-            except Exception:
-                col_info["distinct_values"] = None
-
-            columns_info.append(col_info)
+                "distinct_values": distinct_count,
+                "distinct_values_approx": approximate,
+            })
 
-        return {
+        details = {
             "table_name": table_name,
             "row_count": row_count,
             "columns": columns_info,
+            # O(1) lookup companion to the ordered list; entries are the
+            # same dicts, not copies
+            "columns_by_name": {col["name"]: col for col in columns_info},
             "sample_data": sample,
         }
+        self._details_cache[key] = details
+        return details
 
     def get_column_values(
         self, table_name: str, column_name: str, limit: int = 100
@@ -92,15 +139,23 @@ class DiscoveryTool:
         Returns:
             Dictionary with column value information
         """
+        # Identifiers arrive from model tool calls, so they are checked
+        # against the live schema (both lookups are cached) before being
+        # embedded, then quoted; LIMIT is bound as a parameter
+        if table_name not in self.db.get_table_names():
+            return {"error": f"Unknown table: {table_name}"}
+        if column_name not in {c["name"] for c in self.db.get_table_schema(table_name)}:
+            return {"error": f"Unknown column: {column_name}"}
+
         query = f"""
-            SELECT {column_name}, COUNT(*) as count
-            FROM {table_name}
-            WHERE {column_name} IS NOT NULL
-            GROUP BY {column_name}
+            SELECT "{column_name}", COUNT(*) as count
+            FROM "{table_name}"
+            WHERE "{column_name}" IS NOT NULL
+            GROUP BY "{column_name}"
             ORDER BY count DESC
-            LIMIT {limit}
+            LIMIT :limit
         """
-        results = self.db.execute_query(query)
+        results = self.db.execute_query(query, {"limit": limit})
 
         return {
             "table": table_name,
@@ -119,20 +174,22 @@ class DiscoveryTool:
         Returns:
             List of matching columns with table names
         """
-        search_lower = search_term.lower()
-        matches = []
-
-        for table_name in self.db.get_table_names():
-            schema = self.db.get_table_schema(table_name)
-            for col in schema:
-                if search_lower in col["name"].lower():
-                    matches.append({
-                        "table": table_name,
-                        "column": col["name"],
-                        "type": col["type"],
-                    })
-
-        return matches
+        # One query over the pragma_table_info table-valued function
+        # instead of a per-table introspection loop; instr() keeps the
+        # plain substring semantics (no LIKE wildcard surprises)
+        query = (
+            "SELECT m.name, p.name, p.type "
+            "FROM sqlite_master AS m "
+            "JOIN pragma_table_info(m.name) AS p "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+            "AND instr(lower(p.name), lower(:term)) > 0 "
+            "ORDER BY m.name, p.cid"
+        )
+        rows = self.db.execute_query_raw(query, {"term": search_term})
+        return [
+            {"table": table, "column": column, "type": col_type}
+            for table, column, col_type in rows
+        ]
 
     def get_schema_summary(self) -> str:
         """
@@ -141,6 +198,11 @@ class DiscoveryTool:
         Returns:
             Formatted string describing the database schema
         """
+        key = (self._schema_version(), "summary")
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+
         overview = self.get_database_overview()
 
         lines = [
@@ -156,7 +218,9 @@ class DiscoveryTool:
             lines.append(f"Columns: {', '.join(info['columns'])}")
             lines.append("")
 
-        return "\n".join(lines)
+        summary = "\n".join(lines)
+        self._summary_cache[key] = summary
+        return summary
 
     def get_detailed_schema_for_llm(self) -> str:
         """
@@ -165,6 +229,11 @@ class DiscoveryTool:
         Returns:
             Detailed schema description with sample data
         """
+        key = (self._schema_version(), "detailed")
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+
         tables = self.db.get_table_names()
 
         sections = [
@@ -184,27 +253,39 @@ class DiscoveryTool:
             sections.append("")
             sections.append("### Columns:")
 
-            for col in details["columns"]:
-                pk_marker = " (PK)" if col["primary_key"] else ""
-                nullable = "nullable" if col["nullable"] else "not null"
-                distinct = f", {col['distinct_values']} distinct values" if col["distinct_values"] else ""
-                sections.append(
-                    f"- **{col['name']}**: {col['type']} ({nullable}{pk_marker}{distinct})"
+            # One join per table rather than one list append per column
+            sections.append("\n".join(
+                "- **{}**: {} ({}{}{})".format(
+                    col["name"],
+                    col["type"],
+                    "nullable" if col["nullable"] else "not null",
+                    " (PK)" if col["primary_key"] else "",
+                    f", {col['distinct_values']} distinct values"
+                    if col["distinct_values"] else "",
                 )
+                for col in details["columns"]
+            ))
 
             sections.append("")
             sections.append("### Sample data:")
             if details["sample_data"]:
+                # islice takes the first five columns without building
+                # the full items list; values are capped at 40 chars so
+                # a long text field can't balloon the LLM prompt
                 for i, row in enumerate(details["sample_data"][:3], 1):
-                    row_str = ", ".join(f"{k}={v}" for k, v in list(row.items())[:5])
+                    row_str = ", ".join(
+                        f"{k}={str(v)[:40]}" for k, v in islice(row.items(), 5)
+                    )
                     sections.append(f"  {i}. {row_str}...")
             sections.append("")
 
-        return "\n".join(sections)
+        detailed = "\n".join(sections)
+        self._summary_cache[key] = detailed
+        return detailed
 
 
 # Tool definitions for the Agent SDK
-DISCOVERY_TOOLS = [
+DISCOVERY_TOOLS = (
     {
         "name": "get_database_overview",
         "description": "Get a high-level overview of the AHDC database including all tables and their row counts. Use this first to understand what data is available.",
@@ -265,4 +346,4 @@ DISCOVERY_TOOLS = [
             "required": ["search_term"],
         },
     },
-]
+)
@@ -1,6 +1,8 @@
 """SQL generation and execution tool with security validation."""
 
 import time
+from collections import deque
+from functools import lru_cache
 from typing import Any, Optional
 
 from database.connection import DatabaseConnection
@@ -22,7 +24,14 @@ class SQLExecutorTool:
         self.validator = validator or SQLValidator()
         self.max_rows = max_rows
         self.timeout_seconds = timeout_seconds
-        self.query_history: list[dict] = []
+        # Bounded so long-running agent sessions can't grow history
+        # without limit; deque appends never reallocate
+        self.query_history: deque[dict] = deque(maxlen=1000)
+        # LLM retries and reruns resubmit identical SQL; cache the
+        # LIMIT rewrite so repeats skip the upper()/scan pass. Statement
+        # preparation itself is already reused via the driver's
+        # cached_statements pool in DatabaseConnection.
+        self._ensure_limit_cached = lru_cache(maxsize=256)(self._ensure_limit)
 
     def validate_query(self, sql: str) -> dict[str, Any]:
         """
@@ -67,7 +76,7 @@ class SQLExecutorTool:
             }
 
         # Ensure LIMIT is applied
-        sql_with_limit = self._ensure_limit(sql)
+        sql_with_limit = self._ensure_limit_cached(sql)
 
         start_time = time.time()
 
@@ -110,10 +119,13 @@ class SQLExecutorTool:
 
     def _ensure_limit(self, sql: str) -> str:
         """Ensure the query has a LIMIT clause."""
-        sql_upper = sql.upper().strip()
-
-        # Check if LIMIT already exists
-        if "LIMIT" in sql_upper:
+        # A trailing LIMIT can only live in the last few tokens, so scan
+        # a 64-char tail window instead of upper-casing the whole query.
+        # A LIMIT buried deeper (e.g. in a subquery) just means an outer
+        # cap gets appended, which is harmless
+        tail = sql.rstrip().rstrip(";").rstrip()[-64:].lower()
+        i = tail.rfind("limit")
+        if i >= 0 and (i == 0 or not (tail[i - 1].isalnum() or tail[i - 1] == "_")):
             return sql
 
         # Add LIMIT
@@ -124,7 +136,10 @@ class SQLExecutorTool:
 
     def get_query_history(self, limit: int = 10) -> list[dict]:
         """Get recent query history."""
-        return self.query_history[-limit:]
+        if limit <= 0:
+            return []
+        history = list(self.query_history)
+        return history[-limit:]
 
     def export_results(
         self, results: list[dict], format: str = "csv"
@@ -164,7 +179,7 @@ class SQLExecutorTool:
 
 
 # Tool definitions for the Agent SDK
-SQL_EXECUTOR_TOOLS = [
+SQL_EXECUTOR_TOOLS = (
     {
         "name": "validate_sql",
         "description": "Validate a SQL query for security and correctness WITHOUT executing it. Use this to check if a query is safe before running it. Returns validation status and any errors.",
@@ -214,4 +229,4 @@ SQL_EXECUTOR_TOOLS = [
             "required": ["results"],
         },
     },
-]
+)
@@ -1,12 +1,14 @@
 """Visualization tool for creating charts and deriving insights."""
 
-import json
-from typing import Any, Optional
+from __future__ import annotations
 
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from typing import Any, Optional, TYPE_CHECKING
+
+# pandas/plotly are imported on first use: they cost tens of MB and
+# hundreds of ms at import time, which SQL-only sessions never need
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
 
 
 class VisualizationTool:
@@ -22,6 +24,55 @@ class VisualizationTool:
         "geographic": ["choropleth", "scatter_geo"],
     }
 
+    @staticmethod
+    def _classify_columns(df) -> tuple[list[str], list[str]]:
+        """Split columns into numeric and categorical in one dtype pass.
+
+        Reads the cached block dtypes once instead of two select_dtypes
+        calls; kind codes match select_dtypes semantics ('number'
+        excludes bool, 'object' is kind O).
+        """
+        numeric_cols: list[str] = []
+        categorical_cols: list[str] = []
+        for name, dtype in df.dtypes.items():
+            if dtype.kind in "iufc":
+                numeric_cols.append(name)
+            elif dtype.kind == "O":
+                categorical_cols.append(name)
+        return numeric_cols, categorical_cols
+
+    @staticmethod
+    def _html_shell(figure_json: str, div_id: str) -> str:
+        """Wrap already-serialized figure JSON in a minimal HTML snippet.
+
+        Reuses the JSON string computed for figure_json instead of
+        letting fig.to_html() serialize the whole figure a second time;
+        plotly.js itself still loads from the CDN.
+        """
+        return (
+            f'<div id="{div_id}"></div>'
+            '<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>'
+            f'<script>var f={figure_json};'
+            f'Plotly.newPlot("{div_id}",f.data,f.layout);</script>'
+        )
+
+    @staticmethod
+    def _figure_json(fig) -> str:
+        """Serialize a figure to JSON, using the orjson engine if available.
+
+        orjson serializes plotly's numpy-backed traces several times
+        faster than the stdlib encoder, and validate=False skips the
+        redundant re-validation pass over an already-built figure. NaN
+        still becomes null either way.
+        """
+        import plotly.io as pio
+
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            return fig.to_json()
+        return pio.to_json(fig, engine="orjson", validate=False)
+
     def suggest_charts(self, data: list[dict], query_intent: str = "") -> list[dict]:
         """
         Suggest appropriate chart types based on the data structure.
@@ -36,12 +87,13 @@ class VisualizationTool:
         if not data:
             return []
 
+        import pandas as pd
+
         df = pd.DataFrame(data)
         suggestions = []
 
         # Analyze column types
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
-        categorical_cols = df.select_dtypes(include=["object"]).columns.tolist()
+        numeric_cols, categorical_cols = self._classify_columns(df)
 
         num_rows = len(df)
         num_numeric = len(numeric_cols)
@@ -60,11 +112,23 @@ class VisualizationTool:
         # Find metric columns (numeric columns that are NOT time-related)
         metric_cols = [c for c in numeric_cols if c not in date_cols_numeric]
 
+        # Shared signatures computed once and reused by every branch
+        # below, instead of re-deriving the default y column and
+        # re-scanning the first categorical column per suggestion
+        default_y = (
+            metric_cols[0] if metric_cols
+            else numeric_cols[0] if numeric_cols
+            else None
+        )
+        first_cat_nunique = (
+            df[categorical_cols[0]].nunique() if categorical_cols else 0
+        )
+
         # Bar chart: categorical + numeric (use metric columns for y-axis when available)
-        if num_categorical >= 1 and (metric_cols or num_numeric >= 1):
-            y_col = metric_cols[0] if metric_cols else numeric_cols[0]
+        if num_categorical >= 1 and default_y is not None:
+            y_col = default_y
             # Only suggest bar chart if categorical has more than 1 unique value
-            if df[categorical_cols[0]].nunique() > 1:
+            if first_cat_nunique > 1:
                 suggestions.append({
                     "chart_type": "bar",
                     "x": categorical_cols[0],
@@ -73,10 +137,9 @@ class VisualizationTool:
                 })
 
         # Pie chart: categorical + numeric with few categories
-        if num_categorical >= 1 and (metric_cols or num_numeric >= 1):
-            y_col = metric_cols[0] if metric_cols else numeric_cols[0]
-            unique_cats = df[categorical_cols[0]].nunique()
-            if 2 <= unique_cats <= 10:
+        if num_categorical >= 1 and default_y is not None:
+            y_col = default_y
+            if 2 <= first_cat_nunique <= 10:
                 suggestions.append({
                     "chart_type": "pie",
                     "values": y_col,
@@ -119,8 +182,8 @@ class VisualizationTool:
             })
 
         # Grouped bar: multiple categories
-        if num_categorical >= 2 and (metric_cols or num_numeric >= 1):
-            y_col = metric_cols[0] if metric_cols else numeric_cols[0]
+        if num_categorical >= 2 and default_y is not None:
+            y_col = default_y
             suggestions.append({
                 "chart_type": "grouped_bar",
                 "x": categorical_cols[0],
@@ -153,6 +216,7 @@ class VisualizationTool:
         y: Optional[str] = None,
         color: Optional[str] = None,
         title: Optional[str] = None,
+        include_html: bool = False,
         **kwargs,
     ) -> dict[str, Any]:
         """
@@ -165,6 +229,10 @@ class VisualizationTool:
             y: Column for y-axis
             color: Column for color grouping
             title: Chart title
+            include_html: Also render a standalone HTML snippet. Off by
+                default — every consumer rehydrates from figure_json,
+                and to_html is by far the most expensive part of the
+                old response
             **kwargs: Additional chart-specific parameters
 
         Returns:
@@ -173,8 +241,17 @@ class VisualizationTool:
         if not data:
             return {"error": "No data provided"}
 
+        import pandas as pd
+
         df = pd.DataFrame(data)
 
+        # Downcast numeric columns so Plotly serializes traces as compact
+        # base64 typed arrays instead of plain JSON number lists, roughly
+        # halving payload size for large charts
+        for col in df.select_dtypes(include=["number"]).columns:
+            downcast = "integer" if pd.api.types.is_integer_dtype(df[col]) else "float"
+            df[col] = pd.to_numeric(df[col], downcast=downcast)
+
         try:
             fig = self._create_figure(df, chart_type, x, y, color, title, **kwargs)
 
@@ -186,12 +263,17 @@ class VisualizationTool:
                 margin=dict(l=50, r=50, t=60, b=50),
             )
 
-            return {
+            figure_json = self._figure_json(fig)
+            result = {
                 "success": True,
                 "chart_type": chart_type,
-                "figure_json": fig.to_json(),
-                "figure_html": fig.to_html(include_plotlyjs="cdn", full_html=False),
+                "figure_json": figure_json,
             }
+            if include_html:
+                result["figure_html"] = self._html_shell(
+                    figure_json, div_id=f"chart-{chart_type}"
+                )
+            return result
 
         except Exception as e:
             return {
@@ -211,6 +293,7 @@ class VisualizationTool:
         **kwargs,
     ) -> go.Figure:
         """Create the appropriate Plotly figure."""
+        import plotly.express as px
 
         chart_creators = {
             "bar": lambda: px.bar(df, x=x, y=y, color=color, title=title, **kwargs),
@@ -262,32 +345,44 @@ class VisualizationTool:
         if not data:
             return {"insights": [], "summary": "No data to analyze"}
 
+        import pandas as pd
+
         df = pd.DataFrame(data)
         insights = []
 
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
-        categorical_cols = df.select_dtypes(include=["object"]).columns.tolist()
+        numeric_cols, categorical_cols = self._classify_columns(df)
+
+        # Basic statistics for numeric columns; one describe() call
+        # aggregates every column at once (median and quartiles included)
+        # instead of a describe + median + two quantile calls per column
+        if numeric_cols:
+            numeric = df[numeric_cols]
+            desc = numeric.describe()
+            # IQR outlier counts for every column in one frame-wide
+            # comparison (the quartile Series broadcast across columns)
+            # instead of a boolean mask per column
+            q1 = desc.loc["25%"]
+            q3 = desc.loc["75%"]
+            iqr = q3 - q1
+            outlier_counts = (
+                (numeric < q1 - 1.5 * iqr) | (numeric > q3 + 1.5 * iqr)
+            ).sum()
 
-        # Basic statistics for numeric columns
         for col in numeric_cols:
-            stats = df[col].describe()
+            stats = desc[col]
             insights.append({
                 "type": "statistic",
                 "column": col,
-                "finding": f"{col}: mean={stats['mean']:.2f}, median={df[col].median():.2f}, "
+                "finding": f"{col}: mean={stats['mean']:.2f}, median={stats['50%']:.2f}, "
                           f"range=[{stats['min']:.2f}, {stats['max']:.2f}]",
             })
 
-            # Check for outliers
-            q1 = df[col].quantile(0.25)
-            q3 = df[col].quantile(0.75)
-            iqr = q3 - q1
-            outliers = df[(df[col] < q1 - 1.5 * iqr) | (df[col] > q3 + 1.5 * iqr)]
-            if len(outliers) > 0:
+            outlier_count = int(outlier_counts[col])
+            if outlier_count > 0:
                 insights.append({
                     "type": "outlier",
                     "column": col,
-                    "finding": f"{len(outliers)} potential outliers detected in {col}",
+                    "finding": f"{outlier_count} potential outliers detected in {col}",
                 })
 
         # Top/bottom values for categorical + numeric combinations
@@ -356,6 +451,10 @@ class VisualizationTool:
         if not data or not charts:
             return {"error": "Data and chart configurations required"}
 
+        import pandas as pd
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         n_charts = len(charts)
         cols = min(2, n_charts)
         rows = (n_charts + cols - 1) // cols
@@ -404,16 +503,17 @@ class VisualizationTool:
             template="plotly_white",
         )
 
+        figure_json = self._figure_json(fig)
         return {
             "success": True,
-            "figure_json": fig.to_json(),
-            "figure_html": fig.to_html(include_plotlyjs="cdn", full_html=False),
+            "figure_json": figure_json,
+            "figure_html": self._html_shell(figure_json, div_id="dashboard"),
             "chart_count": n_charts,
         }
 
 
 # Tool definitions for the Agent SDK
-VISUALIZATION_TOOLS = [
+VISUALIZATION_TOOLS = (
     {
         "name": "suggest_charts",
         "description": "Analyze query results and suggest appropriate chart types based on the data structure. Returns a list of recommended visualizations with rationale.",
@@ -488,4 +588,4 @@ VISUALIZATION_TOOLS = [
             "required": ["data"],
         },
     },
-]
+)
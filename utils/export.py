@@ -5,10 +5,20 @@ import io
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 class DataExporter:
     """Exports query results to various formats."""
 
+    # get_summary_stats inspects at most this many rows per column;
+    # type inference and representative min/max/mean don't need a full
+    # scan of an oversized result set
+    SUMMARY_SAMPLE_SIZE = 100_000
+
     @staticmethod
     def to_csv(data: list[dict], include_header: bool = True) -> str:
         """
@@ -45,6 +55,10 @@ class DataExporter:
         Returns:
             JSON string
         """
+        if orjson is not None and indent == 2:
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2
+            ).decode()
         return json.dumps(data, indent=indent, default=str)
 
     @staticmethod
@@ -69,15 +83,15 @@ class DataExporter:
         header = "| " + " | ".join(columns) + " |"
         separator = "| " + " | ".join(["---"] * len(columns)) + " |"
 
-        # Build rows
-        row_lines = []
-        for row in rows:
-            values = [str(row.get(col, "")) for col in columns]
-            # Truncate long values
-            values = [v[:50] + "..." if len(v) > 50 else v for v in values]
-            row_lines.append("| " + " | ".join(values) + " |")
+        # Build rows in one join pass; the generator keeps per-row
+        # intermediates from accumulating in a second list
+        def render(row):
+            values = (str(row.get(col, "")) for col in columns)
+            return "| " + " | ".join(
+                v[:50] + "..." if len(v) > 50 else v for v in values
+            ) + " |"
 
-        result = "\n".join([header, separator] + row_lines)
+        result = "\n".join([header, separator, *map(render, rows)])
 
         if len(data) > max_rows:
             result += f"\n\n*Showing {max_rows} of {len(data)} rows*"
@@ -106,12 +120,26 @@ class DataExporter:
             "columns": {},
         }
 
+        # Value-level stats come from a bounded sample; null counts stay
+        # exact over the full data (a cheap counting pass). For results
+        # within the sample size — everything the executor's row cap can
+        # produce — output is identical to a full scan
+        sample = data[: DataExporter.SUMMARY_SAMPLE_SIZE]
+        sampled = len(sample) < len(data)
+
         for col in columns:
-            values = [row.get(col) for row in data if row.get(col) is not None]
+            values = [row.get(col) for row in sample if row.get(col) is not None]
+
+            if sampled:
+                non_null_count = sum(
+                    1 for row in data if row.get(col) is not None
+                )
+            else:
+                non_null_count = len(values)
 
             col_stats = {
-                "non_null_count": len(values),
-                "null_count": len(data) - len(values),
+                "non_null_count": non_null_count,
+                "null_count": len(data) - non_null_count,
             }
 
             # Try to compute numeric stats